@@ -9,27 +9,90 @@ Centralized configuration for TwistedDebate V4 including:
 - Format-specific prompts and settings
 """
 
+import json
 import os
+import string
+import sys
+import types
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Any, Callable, Final, Mapping, NamedTuple
 
-# Load environment variables from .env file
-load_dotenv()
 
 # === PROJECT PATHS ===
-PROJECT_ROOT = Path(__file__).parent.parent
-APP_DIR = PROJECT_ROOT / "app"
-UTILS_DIR = PROJECT_ROOT / "utils"
-STATIC_DIR = PROJECT_ROOT / "static"
-OUTPUTS_DIR = PROJECT_ROOT / "outputs"
+_PROJECT_ROOT_STR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = Path(_PROJECT_ROOT_STR)
+APP_DIR = Path(os.path.join(_PROJECT_ROOT_STR, "app"))
+UTILS_DIR = Path(os.path.join(_PROJECT_ROOT_STR, "utils"))
+STATIC_DIR = Path(os.path.join(_PROJECT_ROOT_STR, "static"))
+OUTPUTS_DIR = Path(os.path.join(_PROJECT_ROOT_STR, "outputs"))
 
 # Create directories
-for dir_path in [OUTPUTS_DIR]:
-    dir_path.mkdir(exist_ok=True)
+if not OUTPUTS_DIR.is_dir():
+    OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+# === ENVIRONMENT ===
+@lru_cache(maxsize=1)
+def _load_env() -> types.MappingProxyType:
+    """Load the project .env file once (if present) and return a read-only snapshot of the environment."""
+    dotenv_path = os.path.join(_PROJECT_ROOT_STR, ".env")
+    if os.path.isfile(dotenv_path):
+        from dotenv import load_dotenv
+        load_dotenv(dotenv_path)
+    return types.MappingProxyType(dict(os.environ))
+
+
+# Environment snapshot - all settings below read from this
+_ENV = _load_env()
+
+
+def _getbool(name: str, default: bool = False) -> bool:
+    """Read a boolean setting ("1", "true", "yes", "on") from the environment snapshot."""
+    value = _ENV.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _getint(name: str, default: int) -> int:
+    """Read an integer setting from the environment snapshot."""
+    value = _ENV.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def _getport(name: str, default: int) -> int:
+    """Read and validate a TCP port setting from the environment snapshot."""
+    port = _getint(name, default)
+    if not 0 < port < 65536:
+        raise ValueError(f"{name} must be between 1 and 65535, got {port}")
+    return port
 
 
 # === SERVICE URLS ===
-OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
+OLLAMA_URL = _ENV.get("OLLAMA_URL", "http://localhost:11434")
+
+# Ollama servers to spread generations over (comma-separated; defaults to
+# OLLAMA_URL alone). They should all have the debate models pulled.
+OLLAMA_URLS = tuple(
+    u.strip() for u in _ENV.get("OLLAMA_URLS", "").split(",") if u.strip()
+) or (OLLAMA_URL,)
+
+# How a generation picks among OLLAMA_URLS: "least-loaded" (fewest requests
+# in flight) or "hash" (requests with the same system prompt, i.e. the same
+# mode + tone prefix, go to the same server, reusing its prompt cache)
+OLLAMA_BALANCE = _ENV.get("OLLAMA_BALANCE", "least-loaded").strip().lower()
+if OLLAMA_BALANCE not in ("least-loaded", "hash"):
+    raise ValueError(f"OLLAMA_BALANCE must be 'least-loaded' or 'hash', got {OLLAMA_BALANCE!r}")
+
+# Negotiate HTTP/2 with Ollama (requires h2). Only applies to an https://
+# OLLAMA_URL, e.g. a TLS reverse proxy in front of a remote Ollama.
+OLLAMA_HTTP2 = _getbool("OLLAMA_HTTP2")
 
 # API endpoints
 OLLAMA_GENERATE_ENDPOINT = f"{OLLAMA_URL}/api/generate"
@@ -37,14 +100,17 @@ OLLAMA_TAGS_ENDPOINT = f"{OLLAMA_URL}/api/tags"
 
 
 # === DISTORTION MODES ===
-AVAILABLE_DISTORTION_MODES = [
+AVAILABLE_DISTORTION_MODES = (
     "echo_er",      # Amplifies positives, reverberates opportunities
     "invert_er",    # Negates signals, flips polarity, points out missing info
     "what_if_er",   # Hypothesizes new ideas, explores alternative scenarios
     "so_what_er",   # Questions signals, explores implications and consequences
     "cucumb_er",    # Cool-headed academic analysis
     "archiv_er"     # Brings historical context, prior works, literature parallels
-]
+)
+
+# Set form for membership checks
+_DISTORTION_MODE_SET = frozenset(AVAILABLE_DISTORTION_MODES)
 
 # Mode descriptions for UI
 DISTORTION_MODE_DESCRIPTIONS = {
@@ -58,13 +124,16 @@ DISTORTION_MODE_DESCRIPTIONS = {
 
 
 # === TONES ===
-AVAILABLE_TONES = [
+AVAILABLE_TONES = (
     "neutral",      # Clear, standard English
     "technical",    # Precise, jargon-heavy, scientific/engineering register
     "primal",       # Short, punchy, aggressive
     "poetic",       # Lyrical, metaphor-rich, mystical
     "satirical"     # Witty, ironic, humorous
-]
+)
+
+# Set form for membership checks
+_TONE_SET = frozenset(AVAILABLE_TONES)
 
 # Tone descriptions for UI
 TONE_DESCRIPTIONS = {
@@ -77,56 +146,44 @@ TONE_DESCRIPTIONS = {
 
 
 # === MODE PROMPTS ===
-# Direct Ollama prompts for each mode
+# Each mode prompt is split into a static system prompt (the role description)
+# and a short user template. The system prompt is identical on every call, so
+# Ollama can reuse its evaluated prefix instead of recomputing it each turn.
 
-MODE_PROMPTS = {
+MODE_SYSTEM = {
     "echo_er": """You are an ECHO_ER - you amplify positive aspects and opportunities.
 
-Your role: Take the input and highlight strengths, opportunities, and positive potentials. Reverberate what's working and what could work even better. You're an optimist who sees possibilities. Keep your response in 100 words or less.
-
-Input: {text}
-
-Respond with your ECHO_ER perspective:""",
+Your role: Take the input and highlight strengths, opportunities, and positive potentials. Reverberate what's working and what could work even better. You're an optimist who sees possibilities. Keep your response in 100 words or less.""",
 
     "invert_er": """You are an INVERT_ER - you challenge assumptions and flip perspectives.
 
-Your role: Take the input and negate it, point out what's missing, flip the polarity. Question the premise, identify blind spots, and reveal the opposite view. You're a critical thinker who sees what others miss. Keep your response in 100 words or less.
-
-Input: {text}
-
-Respond with your INVERT_ER perspective:""",
+Your role: Take the input and negate it, point out what's missing, flip the polarity. Question the premise, identify blind spots, and reveal the opposite view. You're a critical thinker who sees what others miss. Keep your response in 100 words or less.""",
 
     "what_if_er": """You are a WHAT_IF_ER - you explore alternative scenarios and possibilities.
 
-Your role: Take the input and hypothesize new directions. Ask "what if?" questions, imagine different futures, explore unconventional paths. You're a creative thinker who reimagines possibilities. Keep your response in 100 words or less.
-
-Input: {text}
-
-Respond with your WHAT_IF_ER perspective:""",
+Your role: Take the input and hypothesize new directions. Ask "what if?" questions, imagine different futures, explore unconventional paths. You're a creative thinker who reimagines possibilities. Keep your response in 100 words or less.""",
 
     "so_what_er": """You are a SO_WHAT_ER - you question implications and consequences.
 
-Your role: Take the input and probe its significance. Ask "so what?" and "what are the implications?" Challenge whether it matters and explore downstream effects. You're a pragmatist who demands real-world impact. Keep your response in 100 words or less.
-
-Input: {text}
-
-Respond with your SO_WHAT_ER perspective:""",
+Your role: Take the input and probe its significance. Ask "so what?" and "what are the implications?" Challenge whether it matters and explore downstream effects. You're a pragmatist who demands real-world impact. Keep your response in 100 words or less.""",
 
     "cucumb_er": """You are a CUCUMB_ER - you provide cool, analytical perspective.
 
-Your role: Take the input and analyze it with academic rigor. Stay calm, objective, and systematic. Break it down methodically, cite relevant frameworks, maintain scholarly distance. You're a composed academic who stays cool under pressure. Keep your response in 100 words or less.
-
-Input: {text}
-
-Respond with your CUCUMB_ER perspective:""",
+Your role: Take the input and analyze it with academic rigor. Stay calm, objective, and systematic. Break it down methodically, cite relevant frameworks, maintain scholarly distance. You're a composed academic who stays cool under pressure. Keep your response in 100 words or less.""",
 
     "archiv_er": """You are an ARCHIV_ER - you provide historical context and parallels.
 
-Your role: Take the input and connect it to history, prior works, literature, and past patterns. You're a librarian of ideas who sees echoes and precedents. Bring depth through historical and literary perspective. Keep your response in 100 words or less.
+Your role: Take the input and connect it to history, prior works, literature, and past patterns. You're a librarian of ideas who sees echoes and precedents. Bring depth through historical and literary perspective. Keep your response in 100 words or less."""
+}
 
-Input: {text}
+MODE_USER_TEMPLATES = {
+    mode: "Input: {text}\n\nRespond with your " + mode.upper() + " perspective:"
+    for mode in MODE_SYSTEM
+}
 
-Respond with your ARCHIV_ER perspective:"""
+# Combined single-string prompts for callers that don't send a system prompt
+MODE_PROMPTS = {
+    mode: f"{MODE_SYSTEM[mode]}\n\n{MODE_USER_TEMPLATES[mode]}" for mode in MODE_SYSTEM
 }
 
 
@@ -142,6 +199,20 @@ TONE_INSTRUCTIONS = {
 }
 
 
+# === TURN MODE GUIDANCE ===
+# One-line role guidance per mode for /api/generate-turn prompts (simplified
+# for debates, not TwistedPair distortion)
+
+MODE_GUIDANCE = types.MappingProxyType({
+    "echo_er": "Focus on positive aspects and opportunities. Amplify what's working.",
+    "invert_er": "Challenge assumptions. Point out what's missing or contradictory.",
+    "what_if_er": "Explore alternative scenarios. Ask 'what if' questions.",
+    "so_what_er": "Question implications. Ask 'so what' and demand practical impact.",
+    "cucumb_er": "Stay analytical and composed. Provide systematic analysis.",
+    "archiv_er": "Connect to history and precedents. Provide context from past examples."
+})
+
+
 # === DEBATE FORMAT SETTINGS ===
 
 # Maximum iterations per debate
@@ -153,9 +224,30 @@ MIN_EXCHANGES_BEFORE_CONCLUSION = 2
 # Agreement threshold for convergence (1-10 scale)
 CONVERGENCE_THRESHOLD = 8
 
+# End one-to-one, panel and round-robin debates as soon as the per-round
+# analysis reaches CONVERGENCE_THRESHOLD. Off by default: the built-in
+# analysis (Facilitator._analyze_debate) is a placeholder score that rises
+# with the iteration number, so enabling it only caps debate length.
+STOP_ON_CONVERGENCE = _getbool("STOP_ON_CONVERGENCE")
+
+# Ask examiners that share a model for their questions in one request
+# (many-on-one). Off by default: one request per examiner keeps each
+# persona's voice distinct.
+BATCH_EXAMINER_QUESTIONS = _getbool("BATCH_EXAMINER_QUESTIONS")
+
+# Context budget for a debater's /api/generate-turn prompt: the most recent
+# messages that fit are included, newest first. Token counts are estimated
+# from length, since each Ollama model has its own tokenizer.
+TURN_CONTEXT_TOKENS = max(1, _getint("TURN_CONTEXT_TOKENS", 2048))
+CHARS_PER_TOKEN = 4  # rough average for English text
+
 
 # === DEBATE PROMPTS ===
 
+# Shared response-length instruction and closing cue
+_WORD_LIMIT = "Keep your response in less than 100 words"
+_RESPONSE_TAIL = _WORD_LIMIT + "\n\nYour response:"
+
 # One-to-One Debate Prompt
 ONE_TO_ONE_DEBATE_PROMPT = """You are {participant_name}, participating in a one-to-one debate.
 
@@ -194,9 +286,7 @@ Topic:
 
 {instruction}
 
-Keep your response in less than 100 words
-
-Your response:"""
+""" + _RESPONSE_TAIL
 
 
 # Many-on-One Examination Prompt  
@@ -216,9 +306,7 @@ Topic:
 
 {instruction}
 
-Keep your response in less than 100 words
-
-Your response:"""
+""" + _RESPONSE_TAIL
 
 
 # Panel Discussion Prompt
@@ -238,9 +326,7 @@ Topic:
 
 {instruction}
 
-Keep your response in less than 100 words
-
-Your response:"""
+""" + _RESPONSE_TAIL
 
 
 # Round Robin Prompt
@@ -255,7 +341,7 @@ Topic:
 
 {previous_statements}
 
-It's your turn. Contribute your perspective, respond to others' points, and advance the discussion. Stay true to your {mode} mode with a {tone} tone. Keep your response in less than 100 words.
+It's your turn. Contribute your perspective, respond to others' points, and advance the discussion. Stay true to your {mode} mode with a {tone} tone. """ + _WORD_LIMIT + """.
 
 Your response:"""
 
@@ -277,11 +363,382 @@ Your responsibilities:
 
 {instruction}
 
-Keep your response in less than 100 words
+""" + _WORD_LIMIT + """
 
 Your moderation:"""
 
 
+# Batched Many-on-One Prompt (one request for several examiners on the same model)
+BATCH_DELIMITER = "<<<END>>>"
+
+MANY_ON_ONE_BATCH_PROMPT = """You are playing several examiners in a many-on-one examination.
+
+Topic:
+{topic}
+
+{previous_context}
+
+{current_situation}
+
+Speak as each of these examiners, in this order:
+{examiners}
+
+For each examiner, ask one probing question or present one challenge, staying true to that examiner's distortion mode and tone. """ + _WORD_LIMIT + """ for each question.
+
+Write only the questions, in the order above, each followed by a line containing """ + BATCH_DELIMITER + """
+
+Your questions:"""
+
+
+# === SINGLE-TURN PROMPTS (/api/generate-turn) ===
+
+# Moderator's final summary, after the last iteration
+TURN_SUMMARY_PROMPT = """You are {participant_name}, the moderator of this debate.
+
+Topic: {topic}
+
+Complete debate transcript:
+{context}
+
+This is the FINAL SUMMARY. Your job is to:
+- Summarize EACH participant's key arguments (do NOT omit any participant)
+- Identify points of agreement and disagreement across ALL participants
+- Highlight the strongest points from each perspective
+- Provide a brief but comprehensive conclusion without declaring a winner
+
+IMPORTANT: Make sure to cover ALL participants who spoke. Do not leave anyone out.
+IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into the summary.
+
+Style: {tone_instruction}
+
+Provide a comprehensive closing summary (MAX 200 words)."""
+
+# Moderator's opening
+TURN_MODERATOR_OPENING_PROMPT = """You are {participant_name}, the moderator of this debate.
+
+Topic: {topic}
+
+This is the opening. Your job is to:
+- Welcome the participants
+- Clearly state the debate topic
+- Explain the format briefly
+- Invite participants to begin
+
+Style: {tone_instruction}
+
+IMPORTANT: Do NOT introduce yourself by name or use placeholder text like "[Your Name]". Your role is already displayed. Jump straight into your opening.
+
+Provide a brief opening statement (MAX 100 words). Be welcoming and clear."""
+
+# Participant's opening statement
+TURN_OPENING_PROMPT = """You are {participant_name} in a debate.
+
+Topic: {topic}
+
+This is your opening statement. Present your initial perspective on the topic.
+
+Your role: {mode_hint}
+Style: {tone_instruction}
+
+IMPORTANT: Do NOT introduce yourself by name or use placeholder text like "[Your Name]". Your identity is already displayed. Jump straight into your argument.
+
+Provide a brief opening (MAX 100 words). Be specific and direct."""
+
+# Moderator's turn during the discussion
+TURN_MODERATOR_PROMPT = """You are {participant_name}, the moderator of this debate.
+
+Topic: {topic}
+
+Full discussion so far:
+{context}
+
+Your job is to:
+- Acknowledge key points made by EACH participant who has spoken
+- Ask clarifying questions to explore ideas further
+- Guide the discussion forward constructively
+
+IMPORTANT: If multiple participants have spoken, acknowledge ALL of them. Don't skip anyone.
+IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into moderation.
+
+Style: {tone_instruction}
+
+Provide brief moderation (MAX 100 words)."""
+
+# Examiner questioning the examinee
+TURN_EXAMINER_PROMPT = """You are {participant_name}, an examiner in this examination.
+
+Topic: {topic}
+
+Recent discussion:
+{context}
+
+Your role: {mode_hint}
+Style: {tone_instruction}
+
+IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into your question or challenge.
+
+Ask a probing question or present a challenge to the examinee's position. Be specific and critical (MAX 100 words)."""
+
+# Examinee answering the examiners
+TURN_EXAMINEE_PROMPT = """You are {participant_name}, the examinee responding to examiners.
+
+Topic: {topic}
+
+Recent discussion:
+{context}
+
+Your role: {mode_hint}
+Style: {tone_instruction}
+
+IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into your response.
+
+Respond to the examiners' questions and challenges. Defend or refine your position (MAX 100 words)."""
+
+# Debater responding to the discussion
+TURN_RESPONSE_PROMPT = """You are {participant_name} in a debate.
+
+Topic: {topic}
+
+Recent discussion:
+{context}
+
+Your role: {mode_hint}
+Style: {tone_instruction}
+
+IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into your response.
+
+Respond to the points raised. Provide a brief response (MAX 100 words). Be specific and direct."""
+
+# Batched turn prompt (one request for several /api/generate-turn-batch turns on the same model)
+TURN_BATCH_PROMPT = """You are writing several separate debate turns at once. Each task below is independent: follow its own instructions, role and style, and do not mix content between tasks.
+
+{tasks}
+
+Write only the turns, in the order of the tasks above, each followed by a line containing """ + BATCH_DELIMITER + """
+
+Your turns:"""
+
+
+# === INTERNED TEMPLATES ===
+# Templates are reused as cache keys downstream; interning makes comparisons
+# between identical templates a pointer check.
+
+MODE_SYSTEM = {mode: sys.intern(prompt) for mode, prompt in MODE_SYSTEM.items()}
+MODE_USER_TEMPLATES = {mode: sys.intern(prompt) for mode, prompt in MODE_USER_TEMPLATES.items()}
+MODE_PROMPTS = {mode: sys.intern(prompt) for mode, prompt in MODE_PROMPTS.items()}
+TONE_INSTRUCTIONS = {tone: sys.intern(text) for tone, text in TONE_INSTRUCTIONS.items()}
+
+for _name in (
+    "ONE_TO_ONE_DEBATE_PROMPT",
+    "CROSS_EXAMINATION_PROMPT",
+    "MANY_ON_ONE_PROMPT",
+    "PANEL_DISCUSSION_PROMPT",
+    "ROUND_ROBIN_PROMPT",
+    "MODERATOR_PROMPT",
+    "MANY_ON_ONE_BATCH_PROMPT",
+    "TURN_BATCH_PROMPT",
+    "TURN_SUMMARY_PROMPT",
+    "TURN_MODERATOR_OPENING_PROMPT",
+    "TURN_OPENING_PROMPT",
+    "TURN_MODERATOR_PROMPT",
+    "TURN_EXAMINER_PROMPT",
+    "TURN_EXAMINEE_PROMPT",
+    "TURN_RESPONSE_PROMPT",
+):
+    globals()[_name] = sys.intern(globals()[_name])
+del _name
+
+
+# === MODE + TONE PROMPTS ===
+# System prompt for every (mode, tone) pair, so generation never concatenates
+# the tone instruction onto the mode description per call.
+
+MODE_TONE_PROMPTS = {
+    (mode, tone): sys.intern(f"{MODE_SYSTEM[mode]}\n\n{TONE_INSTRUCTIONS[tone]}")
+    for mode in AVAILABLE_DISTORTION_MODES
+    for tone in AVAILABLE_TONES
+}
+
+
+# === INDEXED TABLES ===
+# Modes and tones get small integer ids; per-mode and per-tone data is stored
+# in parallel tuples so callers can resolve an id once per request and index
+# directly afterwards.
+
+MODE_ID = {mode: i for i, mode in enumerate(AVAILABLE_DISTORTION_MODES)}
+TONE_ID = {tone: i for i, tone in enumerate(AVAILABLE_TONES)}
+
+MODE_SYSTEM_TUP = tuple(MODE_SYSTEM[m] for m in AVAILABLE_DISTORTION_MODES)
+MODE_PROMPTS_TUP = tuple(MODE_PROMPTS[m] for m in AVAILABLE_DISTORTION_MODES)
+MODE_DESC_TUP = tuple(DISTORTION_MODE_DESCRIPTIONS[m] for m in AVAILABLE_DISTORTION_MODES)
+
+TONE_INSTRUCTIONS_TUP = tuple(TONE_INSTRUCTIONS[t] for t in AVAILABLE_TONES)
+TONE_DESC_TUP = tuple(TONE_DESCRIPTIONS[t] for t in AVAILABLE_TONES)
+
+# MODE_TONE_PROMPTS as a flat tuple indexed by MODE_ID * len(TONES) + TONE_ID
+MODE_TONE_PROMPTS_TUP = tuple(
+    MODE_TONE_PROMPTS[(m, t)] for m in AVAILABLE_DISTORTION_MODES for t in AVAILABLE_TONES
+)
+
+
+def mode_tone_index(mode: str, tone: str) -> int:
+    """Get the MODE_TONE_PROMPTS_TUP index for a mode and tone."""
+    return MODE_ID[mode] * len(AVAILABLE_TONES) + TONE_ID[tone]
+
+
+# === COMPILED TEMPLATES ===
+# Templates are parsed with string.Formatter once at import, so rendering is
+# a single join instead of a str.format() parse per call. Escaped braces,
+# conversions and format specs behave exactly as with str.format().
+
+_FORMATTER = string.Formatter()
+
+
+def _compile_template(template: str):
+    """
+    Compile a prompt template into a render function.
+
+    Args:
+        template: Template string using {field} placeholders
+
+    Returns:
+        Function accepting the template fields as keyword arguments
+    """
+    parsed = tuple(_FORMATTER.parse(template))
+
+    # Plain {name} fields lower to a printf-style template, which is
+    # interpolated in C. Extra fields are ignored just like str.format();
+    # values are rendered with str(), which matches format() for the plain
+    # strings the prompts are filled with.
+    if all(
+        name is None or (name.isidentifier() and not spec and not conversion)
+        for _, name, spec, conversion in parsed
+    ):
+        printf_template = "".join(
+            literal.replace("%", "%%") + ("" if name is None else f"%({name})s")
+            for literal, name, _, _ in parsed
+        )
+
+        def render_printf(**fields) -> str:
+            return printf_template % fields
+
+        return render_printf
+
+    def render(**fields) -> str:
+        out = []
+        for literal, name, spec, conversion in parsed:
+            out.append(literal)
+            if name is not None:
+                value = fields[name]
+                if conversion:
+                    value = _FORMATTER.convert_field(value, conversion)
+                out.append(format(value, spec))
+        return "".join(out)
+
+    return render
+
+
+def _build_compiled_prompts() -> dict:
+    """Mode user prompts keyed by distortion mode (sent alongside MODE_SYSTEM)."""
+    return {
+        mode: _compile_template(prompt) for mode, prompt in MODE_USER_TEMPLATES.items()
+    }
+
+
+def _build_compiled_debate_prompts() -> dict:
+    """Debate format prompts keyed by format."""
+    return {
+        "one_to_one": _compile_template(ONE_TO_ONE_DEBATE_PROMPT),
+        "cross_examination": _compile_template(CROSS_EXAMINATION_PROMPT),
+        "many_on_one": _compile_template(MANY_ON_ONE_PROMPT),
+        "panel_discussion": _compile_template(PANEL_DISCUSSION_PROMPT),
+        "round_robin": _compile_template(ROUND_ROBIN_PROMPT),
+        "moderator": _compile_template(MODERATOR_PROMPT),
+        "many_on_one_batch": _compile_template(MANY_ON_ONE_BATCH_PROMPT),
+        "turn_batch": _compile_template(TURN_BATCH_PROMPT),
+    }
+
+
+def _build_compiled_turn_prompts() -> dict:
+    """Single-turn prompts for /api/generate-turn, keyed by turn kind."""
+    return {
+        "summary": _compile_template(TURN_SUMMARY_PROMPT),
+        "moderator_opening": _compile_template(TURN_MODERATOR_OPENING_PROMPT),
+        "opening": _compile_template(TURN_OPENING_PROMPT),
+        "moderator": _compile_template(TURN_MODERATOR_PROMPT),
+        "examiner": _compile_template(TURN_EXAMINER_PROMPT),
+        "examinee": _compile_template(TURN_EXAMINEE_PROMPT),
+        "response": _compile_template(TURN_RESPONSE_PROMPT),
+    }
+
+
+def _build_compiled_turn_prompt_parts() -> dict:
+    """
+    Single-turn prompts split around their {context} slot, keyed by turn kind.
+    
+    Each value is (head, tail): the render functions for the text before and
+    after the discussion context. Everything in them is fixed for a given
+    participant and topic, so callers can render them once per debate and
+    splice in the context each turn. Kinds without a context slot have a
+    tail of None.
+    """
+    parts = {}
+    for kind, template in (
+        ("summary", TURN_SUMMARY_PROMPT),
+        ("moderator_opening", TURN_MODERATOR_OPENING_PROMPT),
+        ("opening", TURN_OPENING_PROMPT),
+        ("moderator", TURN_MODERATOR_PROMPT),
+        ("examiner", TURN_EXAMINER_PROMPT),
+        ("examinee", TURN_EXAMINEE_PROMPT),
+        ("response", TURN_RESPONSE_PROMPT),
+    ):
+        head, slot, tail = template.partition("{context}")
+        parts[kind] = (
+            _compile_template(head),
+            _compile_template(tail) if slot else None,
+        )
+    return parts
+
+
+# Derived tables are built on first attribute access (PEP 562), so imports
+# that only need settings or gain parameters skip template compilation
+_LAZY_TABLES = {
+    "COMPILED_PROMPTS": _build_compiled_prompts,
+    "COMPILED_DEBATE_PROMPTS": _build_compiled_debate_prompts,
+    "COMPILED_TURN_PROMPTS": _build_compiled_turn_prompts,
+    "COMPILED_TURN_PROMPT_PARTS": _build_compiled_turn_prompt_parts,
+}
+
+
+def __getattr__(name: str):
+    builder = _LAZY_TABLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+
+def _table(name: str):
+    """Get a lazily built table from inside this module."""
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+def build_distortion_prompt(text: str, mode: str, tone: str) -> str:
+    """
+    Build a single-string distortion prompt for a mode and tone.
+    
+    Args:
+        text: Input text to distort
+        mode: Distortion mode
+        tone: Tone style
+        
+    Returns:
+        Complete prompt (mode and tone instructions followed by the input)
+    """
+    user_prompt = _table("COMPILED_PROMPTS")[mode](text=text)
+    return f"{MODE_TONE_PROMPTS[(mode, tone)]}\n\n{user_prompt}"
+
+
 # === LLM MODELS ===
 # Available models (auto-detected from Ollama or use this fallback)
 FALLBACK_MODELS = [
@@ -293,10 +750,13 @@ FALLBACK_MODELS = [
 ]
 
 # Default model for generation
-DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gemma3:27b")
+DEFAULT_MODEL = _ENV.get("DEFAULT_MODEL", "gemma3:27b")
 
 # Model for metrics analysis (should be good at following instructions)
-METRICS_MODEL = os.getenv("METRICS_MODEL", "gemma3:27b")
+METRICS_MODEL = _ENV.get("METRICS_MODEL", "gemma3:27b")
+
+# Parsed analyses kept per distinct (topic, transcript); 0 disables the cache
+ANALYSIS_CACHE_SIZE = max(0, _getint("ANALYSIS_CACHE_SIZE", 512))
 
 
 # === DISTORTION PARAMETERS ===
@@ -306,37 +766,119 @@ MIN_GAIN = 1
 MAX_GAIN = 10
 
 # Gain-to-Ollama parameter mapping
-GAIN_TO_PARAMS = {
-    1: {"temperature": 0.3, "top_p": 0.7, "top_k": 20},
-    2: {"temperature": 0.4, "top_p": 0.75, "top_k": 25},
-    3: {"temperature": 0.5, "top_p": 0.8, "top_k": 30},
-    4: {"temperature": 0.6, "top_p": 0.85, "top_k": 35},
-    5: {"temperature": 0.7, "top_p": 0.9, "top_k": 40},
-    6: {"temperature": 0.8, "top_p": 0.92, "top_k": 45},
-    7: {"temperature": 0.9, "top_p": 0.94, "top_k": 50},
-    8: {"temperature": 1.0, "top_p": 0.95, "top_k": 60},
-    9: {"temperature": 1.1, "top_p": 0.97, "top_k": 70},
-    10: {"temperature": 1.2, "top_p": 0.99, "top_k": 80}
-}
+# temperature rises linearly with gain (0.3 at gain 1, +0.1 per step);
+# top_p and top_k flatten/steepen at the high end, so they are listed per gain
+_TOP_P_BY_GAIN = (0.7, 0.75, 0.8, 0.85, 0.9, 0.92, 0.94, 0.95, 0.97, 0.99)
+_TOP_K_BY_GAIN = (20, 25, 30, 35, 40, 45, 50, 60, 70, 80)
+
+
+def _gain_params(gain: int) -> dict:
+    """Build the sampling parameters for one gain level."""
+    i = gain - MIN_GAIN
+    return {
+        "temperature": round(0.2 + 0.1 * gain, 1),
+        "top_p": _TOP_P_BY_GAIN[i],
+        "top_k": _TOP_K_BY_GAIN[i],
+    }
+
+
+GAIN_TO_PARAMS = {g: _gain_params(g) for g in range(MIN_GAIN, MAX_GAIN + 1)}
 
 
-def get_ollama_params(gain: int) -> dict:
+# Read-only sampling parameters indexed by (gain - MIN_GAIN)
+_GAIN_TABLE = tuple(
+    types.MappingProxyType(GAIN_TO_PARAMS[g]) for g in range(MIN_GAIN, MAX_GAIN + 1)
+)
+
+# Direct gain -> parameters lookup for gains 0-31, pre-clamped to the table range
+_GAIN_DISPATCH = tuple(
+    _GAIN_TABLE[min(max(g, MIN_GAIN), MAX_GAIN) - MIN_GAIN] for g in range(32)
+)
+
+
+def get_ollama_params(gain: int) -> Mapping[str, Any]:
     """
     Get Ollama sampling parameters for a given gain level.
     
+    The returned mapping is shared and read-only; callers that need to
+    modify it should copy it with dict(params).
+    
     Args:
         gain: Intensity level (1-10)
         
     Returns:
-        Dict of sampling parameters
+        Read-only mapping of sampling parameters
     """
-    gain = max(MIN_GAIN, min(MAX_GAIN, gain))
-    return GAIN_TO_PARAMS[gain].copy()
+    if 0 <= gain < 32:
+        return _GAIN_DISPATCH[gain]
+    return _GAIN_TABLE[-1] if gain > MAX_GAIN else _GAIN_TABLE[0]
+
+
+class GenerationContext(NamedTuple):
+    """Everything needed to generate for a (mode, tone, gain) combination."""
+    system: str                     # Merged mode + tone system prompt
+    render: Callable[..., str]      # Compiled user prompt template (text=...)
+    params: Mapping[str, Any]       # Read-only sampling parameters
+
+
+@lru_cache(maxsize=512)
+def get_generation_context(mode: str, tone: str, gain: int) -> GenerationContext:
+    """
+    Get the system prompt, user template and sampling parameters for a
+    mode/tone/gain combination. Results are shared and cached.
+    
+    Args:
+        mode: Distortion mode
+        tone: Tone style
+        gain: Intensity level (1-10)
+        
+    Returns:
+        GenerationContext for the combination
+    """
+    return GenerationContext(
+        system=MODE_TONE_PROMPTS[(mode, tone)],
+        render=_table("COMPILED_PROMPTS")[mode],
+        params=get_ollama_params(gain),
+    )
 
 
 # === GPU/MODEL MANAGEMENT ===
-# Ollama keep_alive parameter
-OLLAMA_KEEP_ALIVE = 0  # Immediately release GPU memory after request
+def _getkeepalive(name: str, default):
+    """
+    Read an Ollama keep_alive setting from the environment snapshot.
+    
+    Bare numbers are seconds (negative = keep loaded forever) and are passed
+    to Ollama as ints; anything else is a duration string such as "10m".
+    """
+    value = _ENV.get(name)
+    if value is None:
+        return default
+    value = value.strip()
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+# Ollama keep_alive parameter (0 = immediately release GPU memory after request)
+OLLAMA_KEEP_ALIVE = _getkeepalive("OLLAMA_KEEP_ALIVE", 0)
+
+# Models to load when the server starts and keep resident (comma-separated).
+# Needs a non-zero OLLAMA_KEEP_ALIVE; with a finite one the client re-pings
+# each model every keep_alive/2 so idle debates don't pay a reload.
+OLLAMA_PRELOAD_MODELS = tuple(
+    m.strip() for m in _ENV.get("OLLAMA_PRELOAD_MODELS", "").split(",") if m.strip()
+)
+
+# Requests the Ollama server handles concurrently (its OLLAMA_NUM_PARALLEL,
+# when both read the same .env). Sizes the connection warm-up and caps
+# concurrent debates in Facilitator.run_debates_bulk_async().
+OLLAMA_NUM_PARALLEL = max(1, _getint("OLLAMA_NUM_PARALLEL", 1))
+
+# Models the Ollama server keeps loaded at once (its OLLAMA_MAX_LOADED_MODELS;
+# 0 = Ollama's own default). Reported at startup only: debates mixing more
+# models than this make Ollama swap models between turns.
+OLLAMA_MAX_LOADED_MODELS = max(0, _getint("OLLAMA_MAX_LOADED_MODELS", 0))
 
 
 # === TIMEOUT SETTINGS ===
@@ -347,54 +889,144 @@ HEALTH_CHECK_TIMEOUT = 5   # seconds
 RETRY_ATTEMPTS = 3
 RETRY_DELAY = 2.0  # seconds
 
+# How long a finished background debate job stays available for polling
+DEBATE_JOB_TTL = max(0, _getint("DEBATE_JOB_TTL", 3600))  # seconds
+
 
 # === WEB SERVER SETTINGS ===
-SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
-SERVER_PORT = int(os.getenv("SERVER_PORT", "8004"))
-DEBUG_MODE = os.getenv("DEBUG", "false").lower() == "true"
-RELOAD = DEBUG_MODE
+SERVER_HOST = _ENV.get("SERVER_HOST", "0.0.0.0")
+SERVER_PORT: Final[int] = _getport("SERVER_PORT", 8004)
+DEBUG_MODE = _getbool("DEBUG")
+RELOAD = _getbool("RELOAD", DEBUG_MODE)
+
+# Uvicorn worker processes when started via `python -m app.server`
+# (0 = one per CPU core; ignored with RELOAD). Workers share no memory:
+# background debate jobs, the analysis cache and prompt caches are per
+# process, so job polling needs one worker or sticky routing in front.
+SERVER_WORKERS = max(0, _getint("WORKERS", 1)) or (os.cpu_count() or 1)
 
 
 # === LOGGING ===
-VERBOSE = os.getenv("VERBOSE", "false").lower() == "true"
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+VERBOSE = _getbool("VERBOSE")
+LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO")
 
 
 # === VALIDATION FUNCTIONS ===
+@lru_cache(maxsize=32)
 def validate_gain(gain: int) -> bool:
     """Validate gain is within acceptable range."""
     return MIN_GAIN <= gain <= MAX_GAIN
 
 
+def is_valid_mode(mode: str) -> bool:
+    """Check whether a distortion mode is available."""
+    return mode in _DISTORTION_MODE_SET
+
+
+def is_valid_tone(tone: str) -> bool:
+    """Check whether a tone is available."""
+    return tone in _TONE_SET
+
+
+@lru_cache(maxsize=32)
 def get_mode_description(mode: str) -> str:
     """Get description for a distortion mode."""
     return DISTORTION_MODE_DESCRIPTIONS.get(mode, f"Mode: {mode}")
 
 
+@lru_cache(maxsize=32)
 def get_tone_description(tone: str) -> str:
     """Get description for a tone."""
     return TONE_DESCRIPTIONS.get(tone, f"Tone: {tone}")
 
 
+# === CONFIGURATION SNAPSHOT ===
+@lru_cache(maxsize=1)
+def get_config_snapshot() -> types.MappingProxyType:
+    """
+    Get resolved settings as a read-only, JSON-serializable mapping.
+    
+    Built once per process from the values above.
+    """
+    return types.MappingProxyType({
+        "ollama_url": OLLAMA_URL,
+        "ollama_urls": list(OLLAMA_URLS),
+        "ollama_balance": OLLAMA_BALANCE,
+        "ollama_http2": OLLAMA_HTTP2,
+        "default_model": DEFAULT_MODEL,
+        "metrics_model": METRICS_MODEL,
+        "analysis_cache_size": ANALYSIS_CACHE_SIZE,
+        "modes": list(AVAILABLE_DISTORTION_MODES),
+        "tones": list(AVAILABLE_TONES),
+        "default_gain": DEFAULT_GAIN,
+        "gain_range": [MIN_GAIN, MAX_GAIN],
+        "max_debate_iterations": MAX_DEBATE_ITERATIONS,
+        "convergence_threshold": CONVERGENCE_THRESHOLD,
+        "batch_examiner_questions": BATCH_EXAMINER_QUESTIONS,
+        "stop_on_convergence": STOP_ON_CONVERGENCE,
+        "turn_context_tokens": TURN_CONTEXT_TOKENS,
+        "ollama_keep_alive": OLLAMA_KEEP_ALIVE,
+        "ollama_preload_models": list(OLLAMA_PRELOAD_MODELS),
+        "ollama_num_parallel": OLLAMA_NUM_PARALLEL,
+        "ollama_max_loaded_models": OLLAMA_MAX_LOADED_MODELS,
+        "ollama_timeout": OLLAMA_TIMEOUT,
+        "debate_job_ttl": DEBATE_JOB_TTL,
+        "server_host": SERVER_HOST,
+        "server_port": SERVER_PORT,
+        "server_workers": SERVER_WORKERS,
+        "debug_mode": DEBUG_MODE,
+        "reload": RELOAD,
+        "verbose": VERBOSE,
+        "log_level": LOG_LEVEL,
+    })
+
+
+def write_config_snapshot(path: Path) -> Path:
+    """
+    Write the resolved settings to a JSON file.
+    
+    Args:
+        path: Destination file
+        
+    Returns:
+        The path written
+    """
+    path = Path(path)
+    path.write_text(json.dumps(dict(get_config_snapshot()), indent=2), encoding="utf-8")
+    return path
+
+
 # === CONFIGURATION SUMMARY ===
+_SEP = "=" * 60
+
+
 def print_config_summary():
     """Print configuration summary (useful for debugging)."""
-    print("=" * 60)
-    print("TwistedDebate V4 Configuration")
-    print("=" * 60)
-    print("Multi-Format Debate System")
-    print(f"Ollama URL: {OLLAMA_URL}")
-    print(f"Default Model: {DEFAULT_MODEL}")
-    print(f"Available Modes: {len(AVAILABLE_DISTORTION_MODES)}")
-    print(f"Available Tones: {len(AVAILABLE_TONES)}")
-    print(f"Default Gain: {DEFAULT_GAIN}")
-    print(f"Max Iterations: {MAX_DEBATE_ITERATIONS}")
-    print(f"Convergence Threshold: {CONVERGENCE_THRESHOLD}/10")
-    print(f"Server: {SERVER_HOST}:{SERVER_PORT}")
-    print(f"Debug Mode: {DEBUG_MODE}")
-    print("=" * 60)
+    sys.stdout.write("\n".join([
+        _SEP,
+        "TwistedDebate V4 Configuration",
+        _SEP,
+        "Multi-Format Debate System",
+        f"Ollama URL: {', '.join(OLLAMA_URLS)}",
+        f"Default Model: {DEFAULT_MODEL}",
+        f"Available Modes: {len(AVAILABLE_DISTORTION_MODES)}",
+        f"Available Tones: {len(AVAILABLE_TONES)}",
+        f"Default Gain: {DEFAULT_GAIN}",
+        f"Max Iterations: {MAX_DEBATE_ITERATIONS}",
+        f"Convergence Threshold: {CONVERGENCE_THRESHOLD}/10",
+        f"Ollama Parallel Slots: {OLLAMA_NUM_PARALLEL}",
+        f"Ollama Max Loaded Models: {OLLAMA_MAX_LOADED_MODELS or 'Ollama default'}",
+        f"Server: {SERVER_HOST}:{SERVER_PORT}",
+        f"Workers: {1 if RELOAD else SERVER_WORKERS}",
+        f"Debug Mode: {DEBUG_MODE}",
+        _SEP,
+    ]) + "\n")
 
 
 if __name__ == "__main__":
     # Print configuration when run directly
     print_config_summary()
+    
+    # Optionally dump resolved settings: python -m app.config --snapshot <path>
+    if len(sys.argv) > 2 and sys.argv[1] == "--snapshot":
+        print(f"Snapshot written to: {write_config_snapshot(sys.argv[2])}")
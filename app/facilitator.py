@@ -11,8 +11,11 @@ Orchestrates debates in multiple formats:
 
 import sys
 import os
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import re
+import asyncio
+from collections import deque
+from typing import List, Dict, Any, Awaitable, Mapping, Optional, Callable, Iterable, TypeVar
+from datetime import datetime, timezone
 
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -20,7 +23,7 @@ from utils.ollama_client import OllamaClient, OllamaConnectionError, OllamaGener
 from app.models import (
     DebateFormat,
     ParticipantConfig,
-    DebateMessage,
+    DebateTurn,
     DebateMetrics,
     KeyStatement,
     DebateAnalysis,
@@ -31,6 +34,110 @@ from app.models import (
 from app import config
 
 
+# Leading text up to the first period, long enough to be a key statement
+# (20+ chars) and capped at the 100 chars kept for display
+_FIRST_SENTENCE = re.compile(r"[^.]{20,100}")
+
+
+T = TypeVar("T")
+
+
+def _now() -> datetime:
+    """Current UTC time; formatted as ISO 8601 only when the response is encoded."""
+    return datetime.now(timezone.utc)
+
+
+async def _await(aw: Awaitable[T]) -> T:
+    """Await any awaitable (lets TaskGroup run futures)."""
+    return await aw
+
+
+async def gather_or_cancel(aws: Iterable[Awaitable[T]]) -> List[T]:
+    """
+    Run awaitables concurrently and return their results in order.
+    
+    If one raises, the others are cancelled rather than left running (and
+    holding Ollama slots), and that first exception propagates unwrapped.
+    Uses asyncio.TaskGroup on Python 3.11+, with an equivalent gather-based
+    fallback for 3.10.
+    
+    Args:
+        aws: Coroutines or futures to run
+        
+    Returns:
+        Their results, in the order given
+    """
+    if hasattr(asyncio, "TaskGroup"):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                # TaskGroup only takes coroutines; futures and other
+                # awaitables are awaited from a wrapper task (cancelling the
+                # wrapper cancels what it awaits)
+                tasks = [
+                    tg.create_task(aw if asyncio.iscoroutine(aw) else _await(aw))
+                    for aw in aws
+                ]
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        return [task.result() for task in tasks]
+    
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+class ContextWindow:
+    """
+    Rolling window of the most recent messages, formatted for prompts.
+    
+    Each message is truncated and formatted once when added, so rendering
+    the context before a turn is a single join.
+    """
+    
+    __slots__ = ("_entries",)
+    
+    def __init__(self, size: int):
+        self._entries = deque(maxlen=size)
+    
+    def add(self, msg: DebateTurn):
+        """Add a message, dropping the oldest once the window is full."""
+        self._entries.append(f"{msg.speaker}: {msg.context_snippet}...")
+    
+    def render(self) -> str:
+        """Render the window as prompt context, oldest message first."""
+        if not self._entries:
+            return "(No previous context)"
+        return "\n\n".join(self._entries)
+
+
+class Transcript(list):
+    """
+    Debate turns in the order they were spoken.
+    
+    A plain list, except that each turn added is also passed to an optional
+    callback, so callers can stream turns while the debate is still running.
+    """
+    
+    __slots__ = ("_on_turn",)
+    
+    def __init__(self, on_turn: Optional[Callable[[DebateTurn], None]] = None):
+        super().__init__()
+        self._on_turn = on_turn
+    
+    def append(self, turn: DebateTurn):
+        super().append(turn)
+        if self._on_turn is not None:
+            self._on_turn(turn)
+    
+    def extend(self, turns: Iterable[DebateTurn]):
+        for turn in turns:
+            self.append(turn)
+
+
 class Facilitator:
     """
     Orchestrates V4 multi-format debates.
@@ -46,12 +153,15 @@ class Facilitator:
         Initialize Facilitator V4.
         
         Args:
-            ollama_url: URL of Ollama server
+            ollama_url: URL of Ollama server (default: the configured
+                OLLAMA_URLS, balanced per OLLAMA_BALANCE)
             default_model: Default model for generation
             verbose: Enable debug logging
         """
+        base_urls = None
         if ollama_url is None:
-            ollama_url = config.OLLAMA_URL
+            ollama_url = config.OLLAMA_URLS[0]
+            base_urls = list(config.OLLAMA_URLS)
         if default_model is None:
             default_model = config.DEFAULT_MODEL
             
@@ -61,8 +171,13 @@ class Facilitator:
         # Initialize Ollama client
         self.ollama_client = OllamaClient(
             base_url=ollama_url,
+            base_urls=base_urls,
+            balance=config.OLLAMA_BALANCE,
             default_model=default_model,
-            verbose=verbose
+            verbose=verbose,
+            http2=config.OLLAMA_HTTP2,
+            preload_models=list(config.OLLAMA_PRELOAD_MODELS),
+            max_workers=config.OLLAMA_NUM_PARALLEL
         )
         
         self._log("Facilitator V4 initialized (multi-format debate system)")
@@ -72,6 +187,16 @@ class Facilitator:
         if self.verbose:
             print(f"[Facilitator] {message}")
     
+    def close(self):
+        """Release the Ollama client's HTTP connections."""
+        self.ollama_client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def check_health(self) -> Dict[str, bool]:
         """
         Check health of dependencies.
@@ -91,15 +216,18 @@ class Facilitator:
             "ollama_available": ollama_healthy
         }
     
-    def list_ollama_models(self) -> List[str]:
+    def list_ollama_models(self, refresh: bool = False) -> List[str]:
         """
         List available Ollama models.
         
+        Args:
+            refresh: Bypass the client's cached model list
+        
         Returns:
             List of model names
         """
         try:
-            return self.ollama_client.list_models()
+            return self.ollama_client.list_models(refresh=refresh)
         except Exception as e:
             self._log(f"Error listing models: {e}")
             return config.FALLBACK_MODELS
@@ -113,6 +241,30 @@ class Facilitator:
         participants: List[ParticipantConfig],
         max_iterations: int = 10,
         gain: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Run a complete debate from synchronous code.
+        
+        Thin wrapper around run_debate_async(); must not be called from
+        inside a running event loop.
+        """
+        async def run() -> Dict[str, Any]:
+            try:
+                return await self.run_debate_async(topic, format, participants, max_iterations, gain)
+            finally:
+                # The async client is bound to this short-lived loop
+                await self.ollama_client.aclose()
+        
+        return asyncio.run(run())
+    
+    async def run_debate_async(
+        self,
+        topic: str,
+        format: DebateFormat,
+        participants: List[ParticipantConfig],
+        max_iterations: int = 10,
+        gain: int = 5,
+        on_turn: Optional[Callable[[DebateTurn], None]] = None
     ) -> Dict[str, Any]:
         """
         Run a complete debate based on format.
@@ -123,6 +275,7 @@ class Facilitator:
             participants: List of participant configurations
             max_iterations: Maximum debate iterations
             gain: Debate intensity (1-10)
+            on_turn: Called with each turn as soon as it is added to the transcript
             
         Returns:
             Dict with debate results including messages, metrics, key statements
@@ -131,27 +284,65 @@ class Facilitator:
         self._log(f"Participants: {len(participants)}, Max iterations: {max_iterations}, Gain: {gain}")
         
         # Route to appropriate format handler
-        if format == DebateFormat.ONE_TO_ONE:
-            return self._run_one_to_one_debate(topic, participants, max_iterations, gain)
-        elif format == DebateFormat.CROSS_EXAM:
-            return self._run_cross_examination(topic, participants, max_iterations, gain)
-        elif format == DebateFormat.MANY_ON_ONE:
-            return self._run_many_on_one(topic, participants, max_iterations, gain)
-        elif format == DebateFormat.PANEL:
-            return self._run_panel_discussion(topic, participants, max_iterations, gain)
-        elif format == DebateFormat.ROUND_ROBIN:
-            return self._run_round_robin(topic, participants, max_iterations, gain)
-        else:
+        handler = self._HANDLERS.get(format)
+        if handler is None:
             raise ValueError(f"Unsupported debate format: {format}")
+        return await handler(self, topic, participants, max_iterations, gain, on_turn)
+    
+    def run_debates_bulk(
+        self,
+        specs: List[Dict[str, Any]],
+        max_concurrent: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several debates from synchronous code.
+        
+        Thin wrapper around run_debates_bulk_async(); must not be called
+        from inside a running event loop.
+        """
+        async def run() -> List[Dict[str, Any]]:
+            try:
+                return await self.run_debates_bulk_async(specs, max_concurrent)
+            finally:
+                # The async client is bound to this short-lived loop
+                await self.ollama_client.aclose()
+        
+        return asyncio.run(run())
+    
+    async def run_debates_bulk_async(
+        self,
+        specs: List[Dict[str, Any]],
+        max_concurrent: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several debates concurrently against the same Ollama server.
+        
+        Args:
+            specs: Keyword arguments for run_debate_async(), one dict per debate
+            max_concurrent: Debates allowed to run at once
+                (defaults to config.OLLAMA_NUM_PARALLEL)
+            
+        Returns:
+            Debate results in the same order as specs
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or config.OLLAMA_NUM_PARALLEL)
+        
+        async def run_one(spec: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_debate_async(**spec)
+        
+        self._log(f"Running {len(specs)} debates in bulk")
+        return await gather_or_cancel([run_one(spec) for spec in specs])
     
     # === FORMAT-SPECIFIC HANDLERS ===
     
-    def _run_one_to_one_debate(
+    async def _run_one_to_one_debate(
         self,
         topic: str,
         participants: List[ParticipantConfig],
         max_iterations: int,
-        gain: int
+        gain: int,
+        on_turn: Optional[Callable[[DebateTurn], None]] = None
     ) -> Dict[str, Any]:
         """
         Run a one-to-one debate between two participants.
@@ -161,6 +352,7 @@ class Facilitator:
             participants: List of 2 participants
             max_iterations: Maximum exchanges
             gain: Intensity
+            on_turn: Turn callback (see run_debate_async)
             
         Returns:
             Debate results
@@ -170,7 +362,7 @@ class Facilitator:
         if len(participants) != 2:
             raise ValueError("One-to-one debate requires exactly 2 participants")
         
-        messages = []
+        messages = Transcript(on_turn)
         key_statements = []
         
         debater1 = participants[0]
@@ -179,7 +371,15 @@ class Facilitator:
         # Check for USER participation
         has_user = debater1.model == "USER" or debater2.model == "USER"
         
+        # (message count, iteration) at each key statement checkpoint
+        key_statement_marks = []
+        
+        # Template fields that stay fixed for the whole debate
+        debater1_fields = self._participant_fields(debater1, topic)
+        debater2_fields = self._participant_fields(debater2, topic)
+        
         # Initialize context
+        context = ContextWindow(3)
         previous_context = ""
         opponent_statement = ""
         
@@ -188,73 +388,67 @@ class Facilitator:
             
             # Debater 1's turn
             if debater1.model != "USER":
-                response1 = self._generate_one_to_one_response(
+                response1 = await self._generate_one_to_one_response(
                     participant=debater1,
-                    topic=topic,
+                    fields=debater1_fields,
                     opponent=debater2,
                     opponent_statement=opponent_statement,
                     previous_context=previous_context,
                     gain=gain
                 )
                 
-                msg1 = DebateMessage(
-                    speaker=debater1.label,
-                    content=response1,
-                    role=debater1.role,
-                    iteration=iteration,
-                    timestamp=datetime.utcnow().isoformat()
-                )
+                msg1 = self._make_msg(debater1.label, response1, debater1.role, iteration)
                 messages.append(msg1)
+                context.add(msg1)
                 opponent_statement = response1
-                previous_context = self._build_context(messages[-3:])
+                previous_context = context.render()
             else:
                 # USER turn - return placeholder, frontend will handle
-                msg1 = DebateMessage(
-                    speaker=debater1.label,
-                    content="[Awaiting user input]",
-                    role="user-pending",
-                    iteration=iteration,
-                    timestamp=datetime.utcnow().isoformat()
-                )
+                msg1 = self._make_msg(debater1.label, "[Awaiting user input]", "user-pending", iteration)
                 messages.append(msg1)
                 break  # Stop here and wait for user input
             
             # Debater 2's turn
             if debater2.model != "USER":
-                response2 = self._generate_one_to_one_response(
+                response2 = await self._generate_one_to_one_response(
                     participant=debater2,
-                    topic=topic,
+                    fields=debater2_fields,
                     opponent=debater1,
                     opponent_statement=opponent_statement,
                     previous_context=previous_context,
                     gain=gain
                 )
                 
-                msg2 = DebateMessage(
-                    speaker=debater2.label,
-                    content=response2,
-                    role=debater2.role,
-                    iteration=iteration,
-                    timestamp=datetime.utcnow().isoformat()
-                )
+                msg2 = self._make_msg(debater2.label, response2, debater2.role, iteration)
                 messages.append(msg2)
+                context.add(msg2)
                 opponent_statement = response2
-                previous_context = self._build_context(messages[-3:])
+                previous_context = context.render()
             else:
                 # USER turn
-                msg2 = DebateMessage(
-                    speaker=debater2.label,
-                    content="[Awaiting user input]",
-                    role="user-pending",
-                    iteration=iteration,
-                    timestamp=datetime.utcnow().isoformat()
-                )
+                msg2 = self._make_msg(debater2.label, "[Awaiting user input]", "user-pending", iteration)
                 messages.append(msg2)
                 break
             
-            # Extract key statements every few iterations
+            # Mark key statements for extraction every few iterations; the
+            # extraction itself runs once the debate is over
             if iteration % 2 == 0:
-                key_statements.extend(self._extract_key_statements(messages[-4:], iteration))
+                key_statement_marks.append((len(messages), iteration))
+            
+            # Optionally stop early once the debaters have converged
+            if config.STOP_ON_CONVERGENCE and self._has_converged(
+                self._analyze_debate(topic, messages, iteration)
+            ):
+                self._log(f"[One-to-One] Converged after iteration {iteration}")
+                break
+        
+        # Each checkpoint covers only the messages added since the previous one
+        last_extracted = 0
+        for end, marked_iteration in key_statement_marks:
+            key_statements.extend(
+                self._extract_key_statements(messages[last_extracted:end], marked_iteration)
+            )
+            last_extracted = end
         
         # Analyze final state
         metrics = self._analyze_debate(topic, messages, iteration)
@@ -263,19 +457,20 @@ class Facilitator:
             "topic": topic,
             "format": DebateFormat.ONE_TO_ONE,
             "participants": participants,
-            "messages": messages,
+            "messages": [msg.to_message() for msg in messages],
             "metrics": metrics,
             "keyStatements": key_statements,
             "completed": not has_user or iteration >= max_iterations,
-            "convergenceReached": metrics.agreementScore >= config.CONVERGENCE_THRESHOLD if metrics.agreementScore else False
+            "convergenceReached": self._has_converged(metrics)
         }
     
-    def _run_cross_examination(
+    async def _run_cross_examination(
         self,
         topic: str,
         participants: List[ParticipantConfig],
         max_iterations: int,
-        gain: int
+        gain: int,
+        on_turn: Optional[Callable[[DebateTurn], None]] = None
     ) -> Dict[str, Any]:
         """Run cross-examination format."""
         self._log("[Cross-Exam] Starting examination")
@@ -286,71 +481,52 @@ class Facilitator:
         examiner = participants[0]
         examinee = participants[1]
         
-        messages = []
+        examiner_fields = self._participant_fields(examiner, topic)
+        examinee_fields = self._participant_fields(examinee, topic)
+        
+        context = ContextWindow(3)
+        messages = Transcript(on_turn)
         key_statements = []
         
         # Examinee's initial statement
-        initial_statement = self._generate_with_mode_tone(
+        initial_statement = await self._generate_with_mode_tone(
             prompt=f"State your position on: {topic}",
             participant=examinee,
             gain=gain
         )
         
-        messages.append(DebateMessage(
-            speaker=examinee.label,
-            content=initial_statement,
-            role=examinee.role,
-            iteration=0,
-            timestamp=datetime.utcnow().isoformat()
-        ))
+        messages.append(self._make_msg(examinee.label, initial_statement, examinee.role, 0))
+        context.add(messages[-1])
         
         # Examination rounds
         for iteration in range(1, max_iterations + 1):
             self._log(f"[Cross-Exam] Round {iteration}/{max_iterations}")
             
             # Examiner asks question
-            question_prompt = config.CROSS_EXAMINATION_PROMPT.format(
-                participant_name=examiner.label,
-                role=examiner.role,
-                mode=examiner.mode.value,
-                tone=examiner.tone.value,
-                topic=topic,
-                previous_context=self._build_context(messages[-3:]),
+            question_prompt = config.COMPILED_DEBATE_PROMPTS["cross_examination"](
+                **examiner_fields,
+                previous_context=context.render(),
                 other_perspective=messages[-1].content,
                 instruction="Generate a probing question or challenge to the examinee's position."
             )
             
-            question = self._generate_with_params(question_prompt, examiner.model, gain)
+            question = await self._generate_with_params(question_prompt, examiner.model, gain)
             
-            messages.append(DebateMessage(
-                speaker=examiner.label,
-                content=question,
-                role=examiner.role,
-                iteration=iteration,
-                timestamp=datetime.utcnow().isoformat()
-            ))
+            messages.append(self._make_msg(examiner.label, question, examiner.role, iteration))
+            context.add(messages[-1])
             
             # Examinee responds
-            response_prompt = config.CROSS_EXAMINATION_PROMPT.format(
-                participant_name=examinee.label,
-                role=examinee.role,
-                mode=examinee.mode.value,
-                tone=examinee.tone.value,
-                topic=topic,
-                previous_context=self._build_context(messages[-3:]),
+            response_prompt = config.COMPILED_DEBATE_PROMPTS["cross_examination"](
+                **examinee_fields,
+                previous_context=context.render(),
                 other_perspective=question,
                 instruction="Respond to the examiner's question or challenge. Defend or refine your position."
             )
             
-            response = self._generate_with_params(response_prompt, examinee.model, gain)
+            response = await self._generate_with_params(response_prompt, examinee.model, gain)
             
-            messages.append(DebateMessage(
-                speaker=examinee.label,
-                content=response,
-                role=examinee.role,
-                iteration=iteration,
-                timestamp=datetime.utcnow().isoformat()
-            ))
+            messages.append(self._make_msg(examinee.label, response, examinee.role, iteration))
+            context.add(messages[-1])
         
         metrics = self._analyze_debate(topic, messages, max_iterations)
         key_statements = self._extract_key_statements(messages, max_iterations)
@@ -359,19 +535,20 @@ class Facilitator:
             "topic": topic,
             "format": DebateFormat.CROSS_EXAM,
             "participants": participants,
-            "messages": messages,
+            "messages": [msg.to_message() for msg in messages],
             "metrics": metrics,
             "keyStatements": key_statements,
             "completed": True,
             "convergenceReached": False  # Not applicable for cross-exam
         }
     
-    def _run_many_on_one(
+    async def _run_many_on_one(
         self,
         topic: str,
         participants: List[ParticipantConfig],
         max_iterations: int,
-        gain: int
+        gain: int,
+        on_turn: Optional[Callable[[DebateTurn], None]] = None
     ) -> Dict[str, Any]:
         """Run many-on-one examination format."""
         self._log("[Many-on-One] Starting examination")
@@ -382,77 +559,67 @@ class Facilitator:
         
         self._log(f"[Many-on-One] {len(examiners)} examiners vs 1 examinee")
         
-        messages = []
+        examinee_fields = self._participant_fields(examinee, topic)
+        examiner_fields = [self._participant_fields(ex, topic) for ex in examiners]
+        
+        # Examiners see the last 5 messages, the examinee's reply the last 10
+        recent_context = ContextWindow(5)
+        round_context = ContextWindow(10)
+        messages = Transcript(on_turn)
         key_statements = []
         
         # Examinee's initial statement
-        initial_statement = self._generate_with_mode_tone(
+        initial_statement = await self._generate_with_mode_tone(
             prompt=f"State your position on: {topic}",
             participant=examinee,
             gain=gain
         )
         
-        messages.append(DebateMessage(
-            speaker=examinee.label,
-            content=initial_statement,
-            role=examinee.role,
-            iteration=0,
-            timestamp=datetime.utcnow().isoformat()
-        ))
+        messages.append(self._make_msg(examinee.label, initial_statement, examinee.role, 0))
+        recent_context.add(messages[-1])
+        round_context.add(messages[-1])
         
         # Examination rounds
         for iteration in range(1, max_iterations + 1):
             self._log(f"[Many-on-One] Round {iteration}/{max_iterations}")
             
-            # Each examiner asks a question
-            for examiner in examiners:
-                question_prompt = config.MANY_ON_ONE_PROMPT.format(
-                    participant_name=examiner.label,
-                    role=examiner.role,
-                    mode=examiner.mode.value,
-                    tone=examiner.tone.value,
-                    topic=topic,
-                    previous_context=self._build_context(messages[-5:]),
-                    current_situation=f"Examinee's current position: {messages[-1].content[:200]}...",
-                    instruction="Ask a probing question or present a challenge."
-                )
-                
-                question = self._generate_with_params(question_prompt, examiner.model, gain)
-                
-                messages.append(DebateMessage(
-                    speaker=examiner.label,
-                    content=question,
-                    role=examiner.role,
-                    iteration=iteration,
-                    timestamp=datetime.utcnow().isoformat()
-                ))
+            # Each examiner asks a question; all questions in a round see the
+            # same context, so they are generated concurrently
+            previous_context = recent_context.render()
+            current_situation = f"Examinee's current position: {messages[-1].preview_snippet}..."
+            
+            questions = await self._generate_examiner_questions(
+                examiners, examiner_fields, previous_context, current_situation, gain
+            )
+            
+            timestamp = _now()
+            round_turns = [
+                self._make_msg(examiner.label, question, examiner.role, iteration, timestamp)
+                for examiner, question in zip(examiners, questions)
+            ]
+            messages.extend(round_turns)
+            for turn in round_turns:
+                recent_context.add(turn)
+                round_context.add(turn)
             
             # Examinee responds to all questions
             all_questions = "\n\n".join([
                 f"{msg.speaker}: {msg.content}"
-                for msg in messages[-(len(examiners)):]
+                for msg in round_turns
             ])
             
-            response_prompt = config.MANY_ON_ONE_PROMPT.format(
-                participant_name=examinee.label,
-                role=examinee.role,
-                mode=examinee.mode.value,
-                tone=examinee.tone.value,
-                topic=topic,
-                previous_context=self._build_context(messages[-10:]),
+            response_prompt = config.COMPILED_DEBATE_PROMPTS["many_on_one"](
+                **examinee_fields,
+                previous_context=round_context.render(),
                 current_situation=f"Questions from examiners:\n{all_questions}",
                 instruction="Respond to all examiners' questions and challenges."
             )
             
-            response = self._generate_with_params(response_prompt, examinee.model, gain)
+            response = await self._generate_with_params(response_prompt, examinee.model, gain)
             
-            messages.append(DebateMessage(
-                speaker=examinee.label,
-                content=response,
-                role=examinee.role,
-                iteration=iteration,
-                timestamp=datetime.utcnow().isoformat()
-            ))
+            messages.append(self._make_msg(examinee.label, response, examinee.role, iteration))
+            recent_context.add(messages[-1])
+            round_context.add(messages[-1])
         
         metrics = self._analyze_debate(topic, messages, max_iterations)
         key_statements = self._extract_key_statements(messages, max_iterations)
@@ -461,19 +628,20 @@ class Facilitator:
             "topic": topic,
             "format": DebateFormat.MANY_ON_ONE,
             "participants": participants,
-            "messages": messages,
+            "messages": [msg.to_message() for msg in messages],
             "metrics": metrics,
             "keyStatements": key_statements,
             "completed": True,
             "convergenceReached": False
         }
     
-    def _run_panel_discussion(
+    async def _run_panel_discussion(
         self,
         topic: str,
         participants: List[ParticipantConfig],
         max_iterations: int,
-        gain: int
+        gain: int,
+        on_turn: Optional[Callable[[DebateTurn], None]] = None
     ) -> Dict[str, Any]:
         """Run panel discussion with moderator format."""
         self._log("[Panel] Starting discussion")
@@ -484,190 +652,301 @@ class Facilitator:
         
         self._log(f"[Panel] 1 moderator + {len(panelists)} panelists")
         
-        messages = []
+        panelist_fields = [self._participant_fields(p, topic) for p in panelists]
+        
+        context = ContextWindow(5)
+        messages = Transcript(on_turn)
         key_statements = []
         
         has_user_moderator = moderator.model == "USER"
         
         # Moderator opens discussion
         if not has_user_moderator:
-            opening = self._generate_moderator_opening(topic, moderator, gain)
-            messages.append(DebateMessage(
-                speaker=moderator.label,
-                content=opening,
-                role=moderator.role,
-                iteration=0,
-                timestamp=datetime.utcnow().isoformat()
-            ))
+            opening = await self._generate_moderator_opening(topic, moderator, gain)
+            messages.append(self._make_msg(moderator.label, opening, moderator.role, 0))
+            context.add(messages[-1])
         else:
-            messages.append(DebateMessage(
-                speaker=moderator.label,
-                content="[Awaiting moderator opening]",
-                role="user-pending",
-                iteration=0,
-                timestamp=datetime.utcnow().isoformat()
-            ))
+            messages.append(self._make_msg(moderator.label, "[Awaiting moderator opening]", "user-pending", 0))
+            context.add(messages[-1])
             # Would need to wait for user input here
         
+        # The opening (or its placeholder) guides every round
+        moderator_guidance = messages[0].content
+        
         # Discussion rounds
         for iteration in range(1, max_iterations + 1):
             self._log(f"[Panel] Round {iteration}/{max_iterations}")
             
-            # Each panelist contributes
-            for panelist in panelists:
-                statement_prompt = config.PANEL_DISCUSSION_PROMPT.format(
-                    participant_name=panelist.label,
-                    role=panelist.role,
-                    mode=panelist.mode.value,
-                    tone=panelist.tone.value,
-                    topic=topic,
-                    moderator_guidance=messages[0].content if messages else "",
-                    previous_statements=self._build_context(messages[-5:]),
-                    instruction="Share your perspective and respond to others' points."
+            # Each panelist contributes in turn, seeing the statements made
+            # earlier in this round (turns stay sequential for that reason)
+            round_turns = []
+            for panelist, fields in zip(panelists, panelist_fields):
+                statement = await self._generate_with_params(
+                    config.COMPILED_DEBATE_PROMPTS["panel_discussion"](
+                        **fields,
+                        moderator_guidance=moderator_guidance,
+                        previous_statements=context.render(),
+                        instruction="Share your perspective and respond to others' points."
+                    ),
+                    panelist.model,
+                    gain
                 )
                 
-                statement = self._generate_with_params(statement_prompt, panelist.model, gain)
-                
-                messages.append(DebateMessage(
-                    speaker=panelist.label,
-                    content=statement,
-                    role=panelist.role,
-                    iteration=iteration,
-                    timestamp=datetime.utcnow().isoformat()
-                ))
+                turn = self._make_msg(panelist.label, statement, panelist.role, iteration)
+                messages.append(turn)
+                context.add(turn)
+                round_turns.append(turn)
             
             # Moderator summarizes/guides (every other round)
             if iteration % 2 == 0 and not has_user_moderator:
-                moderation = self._generate_moderator_summary(
-                    topic, messages[-len(panelists):], moderator, gain
+                moderation = await self._generate_moderator_summary(
+                    topic, round_turns, moderator, gain
                 )
                 
-                messages.append(DebateMessage(
-                    speaker=moderator.label,
-                    content=moderation,
-                    role=moderator.role,
-                    iteration=iteration,
-                    timestamp=datetime.utcnow().isoformat()
-                ))
+                messages.append(self._make_msg(moderator.label, moderation, moderator.role, iteration))
+                context.add(messages[-1])
+            
+            # Optionally stop early once the panel has converged
+            if config.STOP_ON_CONVERGENCE and self._has_converged(
+                self._analyze_debate(topic, messages, iteration)
+            ):
+                self._log(f"[Panel] Converged after round {iteration}")
+                break
         
-        metrics = self._analyze_debate(topic, messages, max_iterations)
-        key_statements = self._extract_key_statements(messages, max_iterations)
+        metrics = self._analyze_debate(topic, messages, iteration)
+        key_statements = self._extract_key_statements(messages, iteration)
         
         return {
             "topic": topic,
             "format": DebateFormat.PANEL,
             "participants": participants,
-            "messages": messages,
+            "messages": [msg.to_message() for msg in messages],
             "metrics": metrics,
             "keyStatements": key_statements,
             "completed": not has_user_moderator or iteration >= max_iterations,
-            "convergenceReached": metrics.agreementScore >= config.CONVERGENCE_THRESHOLD if metrics.agreementScore else False
+            "convergenceReached": self._has_converged(metrics)
         }
     
-    def _run_round_robin(
+    async def _run_round_robin(
         self,
         topic: str,
         participants: List[ParticipantConfig],
         max_iterations: int,
-        gain: int
+        gain: int,
+        on_turn: Optional[Callable[[DebateTurn], None]] = None
     ) -> Dict[str, Any]:
         """Run round-robin discussion format."""
         self._log("[Round Robin] Starting discussion")
         self._log(f"[Round Robin] {len(participants)} participants")
         
-        messages = []
+        participant_fields = [self._participant_fields(p, topic) for p in participants]
+        
+        context = ContextWindow(len(participants))
+        messages = Transcript(on_turn)
         key_statements = []
         
         # Round-robin iterations
         for iteration in range(1, max_iterations + 1):
             self._log(f"[Round Robin] Round {iteration}/{max_iterations}")
             
-            # Each participant speaks in turn
-            for participant in participants:
-                statement_prompt = config.ROUND_ROBIN_PROMPT.format(
-                    participant_name=participant.label,
-                    mode=participant.mode.value,
-                    tone=participant.tone.value,
-                    topic=topic,
-                    previous_statements=self._build_context(messages[-len(participants):])
+            # Each participant speaks in turn, responding to the last full
+            # round of statements (including this round's earlier speakers)
+            for participant, fields in zip(participants, participant_fields):
+                statement = await self._generate_with_params(
+                    config.COMPILED_DEBATE_PROMPTS["round_robin"](
+                        **fields,
+                        previous_statements=context.render()
+                    ),
+                    participant.model,
+                    gain
                 )
                 
-                statement = self._generate_with_params(statement_prompt, participant.model, gain)
-                
-                messages.append(DebateMessage(
-                    speaker=participant.label,
-                    content=statement,
-                    role=participant.role,
-                    iteration=iteration,
-                    timestamp=datetime.utcnow().isoformat()
-                ))
+                turn = self._make_msg(participant.label, statement, participant.role, iteration)
+                messages.append(turn)
+                context.add(turn)
+            
+            # Optionally stop early once the discussion has converged
+            if config.STOP_ON_CONVERGENCE and self._has_converged(
+                self._analyze_debate(topic, messages, iteration)
+            ):
+                self._log(f"[Round Robin] Converged after round {iteration}")
+                break
         
-        metrics = self._analyze_debate(topic, messages, max_iterations)
-        key_statements = self._extract_key_statements(messages, max_iterations)
+        metrics = self._analyze_debate(topic, messages, iteration)
+        key_statements = self._extract_key_statements(messages, iteration)
         
         return {
             "topic": topic,
             "format": DebateFormat.ROUND_ROBIN,
             "participants": participants,
-            "messages": messages,
+            "messages": [msg.to_message() for msg in messages],
             "metrics": metrics,
             "keyStatements": key_statements,
             "completed": True,
-            "convergenceReached": metrics.agreementScore >= config.CONVERGENCE_THRESHOLD if metrics.agreementScore else False
+            "convergenceReached": self._has_converged(metrics)
         }
     
     # === HELPER METHODS ===
     
-    def _generate_one_to_one_response(
+    def _make_msg(
+        self,
+        speaker: str,
+        content: str,
+        role: str,
+        iteration: int,
+        timestamp: Optional[datetime] = None
+    ) -> DebateTurn:
+        """Create a debate turn, stamped now unless a timestamp is given."""
+        return DebateTurn(speaker, content, role, iteration, timestamp or _now())
+    
+    def _participant_fields(
         self,
         participant: ParticipantConfig,
-        topic: str,
+        topic: str
+    ) -> Dict[str, str]:
+        """Prompt template fields that stay fixed for a participant during a debate."""
+        return {
+            "participant_name": participant.label,
+            "role": participant.role,
+            "mode": participant.mode,
+            "tone": participant.tone,
+            "topic": topic,
+        }
+    
+    async def _generate_one_to_one_response(
+        self,
+        participant: ParticipantConfig,
+        fields: Dict[str, str],
         opponent: ParticipantConfig,
         opponent_statement: str,
         previous_context: str,
         gain: int
     ) -> str:
         """Generate a response in one-to-one debate."""
-        prompt = config.ONE_TO_ONE_DEBATE_PROMPT.format(
-            participant_name=participant.label,
-            role=participant.role,
-            mode=participant.mode.value,
-            tone=participant.tone.value,
-            topic=topic,
+        prompt = config.COMPILED_DEBATE_PROMPTS["one_to_one"](
+            **fields,
             previous_context=previous_context,
             opponent_name=opponent.label,
             opponent_statement=opponent_statement or "(Opening statement)"
         )
         
-        return self._generate_with_params(prompt, participant.model, gain)
+        return await self._generate_with_params(prompt, participant.model, gain)
+    
+    async def _generate_examiner_questions(
+        self,
+        examiners: List[ParticipantConfig],
+        examiner_fields: List[Dict[str, str]],
+        previous_context: str,
+        current_situation: str,
+        gain: int
+    ) -> List[str]:
+        """
+        Generate one question per examiner for a many-on-one round.
+        
+        With config.BATCH_EXAMINER_QUESTIONS, examiners that share a model
+        are asked in a single request; otherwise (or if a batched reply
+        cannot be split) each examiner gets its own request.
+        
+        Returns:
+            Questions in the same order as examiners
+        """
+        async def ask_one(i: int) -> List[str]:
+            prompt = config.COMPILED_DEBATE_PROMPTS["many_on_one"](
+                **examiner_fields[i],
+                previous_context=previous_context,
+                current_situation=current_situation,
+                instruction="Ask a probing question or present a challenge."
+            )
+            return [await self._generate_with_params(prompt, examiners[i].model, gain)]
+        
+        async def ask_group(indexes: List[int]) -> List[str]:
+            roster = "\n".join(
+                f"{n}. {examiner_fields[i]['participant_name']} "
+                f"(Role: {examiner_fields[i]['role']}, "
+                f"Distortion Mode: {examiner_fields[i]['mode']}, "
+                f"Tone: {examiner_fields[i]['tone']})"
+                for n, i in enumerate(indexes, 1)
+            )
+            prompt = config.COMPILED_DEBATE_PROMPTS["many_on_one_batch"](
+                topic=examiner_fields[indexes[0]]["topic"],
+                previous_context=previous_context,
+                current_situation=current_situation,
+                examiners=roster
+            )
+            reply = await self._generate_with_params(prompt, examiners[indexes[0]].model, gain)
+            
+            parts = [p.strip() for p in reply.split(config.BATCH_DELIMITER)]
+            parts = [p for p in parts if p]
+            if len(parts) == len(indexes):
+                return parts
+            
+            self._log(f"[Many-on-One] Batched reply split into {len(parts)} parts, "
+                      f"expected {len(indexes)}; asking individually")
+            replies = await gather_or_cancel([ask_one(i) for i in indexes])
+            return [r[0] for r in replies]
+        
+        # Group examiner positions by model (only when batching is enabled)
+        groups: Dict[str, List[int]] = {}
+        for i, examiner in enumerate(examiners):
+            key = examiner.model if config.BATCH_EXAMINER_QUESTIONS else str(i)
+            groups.setdefault(key, []).append(i)
+        
+        group_list = list(groups.values())
+        replies = await gather_or_cancel([
+            ask_group(indexes) if len(indexes) > 1 else ask_one(indexes[0])
+            for indexes in group_list
+        ])
+        
+        questions = [""] * len(examiners)
+        for indexes, texts in zip(group_list, replies):
+            for i, text in zip(indexes, texts):
+                questions[i] = text
+        return questions
     
-    def _generate_with_mode_tone(
+    async def _generate_with_mode_tone(
         self,
         prompt: str,
         participant: ParticipantConfig,
         gain: int
     ) -> str:
-        """Generate text with mode and tone applied."""
-        mode_prompt = config.MODE_PROMPTS[participant.mode.value].format(text=prompt)
-        tone_instruction = config.TONE_INSTRUCTIONS[participant.tone.value]
+        """
+        Generate text with mode and tone applied.
         
-        full_prompt = f"{mode_prompt}\n\n{tone_instruction}"
+        The mode's role description and tone instruction are sent as the
+        system prompt so the prefix stays identical across turns and can be
+        reused by Ollama.
+        """
+        context = config.get_generation_context(
+            participant.mode, participant.tone, gain
+        )
         
-        return self._generate_with_params(full_prompt, participant.model, gain)
+        return await self._generate_with_params(
+            context.render(text=prompt), participant.model, gain,
+            system=context.system, params=context.params
+        )
     
-    def _generate_with_params(
+    async def _generate_with_params(
         self,
         prompt: str,
         model: str,
-        gain: int
+        gain: int,
+        system: Optional[str] = None,
+        params: Optional[Mapping[str, Any]] = None
     ) -> str:
-        """Generate text using Ollama with gain-based parameters."""
-        params = config.get_ollama_params(gain)
+        """
+        Generate text using Ollama with gain-based parameters.
+        
+        Callers that already hold the resolved sampling parameters for
+        this gain (e.g. from a GenerationContext) can pass them as params.
+        """
+        if params is None:
+            params = config.get_ollama_params(gain)
         
         try:
-            result = self.ollama_client.generate(
+            result = await self.ollama_client.agenerate(
                 prompt=prompt,
                 model=model,
+                system=system,
                 **params
             )
             return result
@@ -675,56 +954,46 @@ class Facilitator:
             self._log(f"Generation error: {e}")
             return f"[Error generating response: {str(e)}]"
     
-    def _generate_moderator_opening(
+    async def _generate_moderator_opening(
         self,
         topic: str,
         moderator: ParticipantConfig,
         gain: int
     ) -> str:
         """Generate moderator's opening statement."""
-        prompt = config.MODERATOR_PROMPT.format(
+        prompt = config.COMPILED_DEBATE_PROMPTS["moderator"](
             topic=topic,
             previous_statements="",
             instruction="Open the panel discussion. Introduce the topic and set the tone for productive dialogue."
         )
         
-        return self._generate_with_params(prompt, moderator.model, gain)
+        return await self._generate_with_params(prompt, moderator.model, gain)
     
-    def _generate_moderator_summary(
+    async def _generate_moderator_summary(
         self,
         topic: str,
-        recent_messages: List[DebateMessage],
+        recent_messages: List[DebateTurn],
         moderator: ParticipantConfig,
         gain: int
     ) -> str:
         """Generate moderator's summary/guidance."""
         previous_statements = "\n\n".join([
-            f"{msg.speaker}: {msg.content[:200]}..."
+            f"{msg.speaker}: {msg.preview_snippet}..."
             for msg in recent_messages
         ])
         
-        prompt = config.MODERATOR_PROMPT.format(
+        prompt = config.COMPILED_DEBATE_PROMPTS["moderator"](
             topic=topic,
             previous_statements=previous_statements,
             instruction="Summarize key points, identify areas of agreement/disagreement, and guide the next phase of discussion."
         )
         
-        return self._generate_with_params(prompt, moderator.model, gain)
-    
-    def _build_context(self, messages: List[DebateMessage]) -> str:
-        """Build context string from recent messages."""
-        if not messages:
-            return "(No previous context)"
-        
-        return "\n\n".join([
-            f"{msg.speaker}: {msg.content[:300]}..."
-            for msg in messages
-        ])
+        return await self._generate_with_params(prompt, moderator.model, gain)
     
     def _analyze_debate(
         self,
         topic: str,
-        messages: List[DebateMessage],
+        messages: List[DebateTurn],
         iteration: int
     ) -> DebateMetrics:
         """
@@ -735,7 +1004,7 @@ class Facilitator:
         # Simplified metrics generation
         agreementScore = min(5.0 + (iteration * 0.5), 10.0)  # Gradually increases
         
-        return DebateMetrics(
+        return DebateMetrics.model_construct(
             iteration=iteration,
             status="In Progress" if iteration < config.MAX_DEBATE_ITERATIONS else "Completed",
             agreementScore=agreementScore,
@@ -745,20 +1014,35 @@ class Facilitator:
             topicDrift=SensitivityLevel.LOW
         )
     
+    def _has_converged(self, metrics: DebateMetrics) -> bool:
+        """Check whether metrics show agreement at or above the convergence threshold."""
+        return metrics.agreementScore >= config.CONVERGENCE_THRESHOLD if metrics.agreementScore else False
+    
     def _extract_key_statements(
         self,
-        messages: List[DebateMessage],
+        messages: List[DebateTurn],
         iteration: int
     ) -> List[KeyStatement]:
         """Extract key statements from messages."""
         # Simplified - just take first sentence of each message
         statements = []
         for msg in messages:
-            first_sentence = msg.content.split('.')[0] + '.'
-            if len(first_sentence) > 20:  # Only if meaningful
+            match = _FIRST_SENTENCE.match(msg.content)
+            if match:  # Only if meaningful
+                text = match.group()
                 statements.append(KeyStatement(
                     speaker=msg.speaker,
-                    text=first_sentence[:100],
+                    text=text + '.' if len(text) < 100 else text,
                     iteration=iteration
                 ))
         return statements
+
+
+# Format handlers, keyed by debate format
+Facilitator._HANDLERS = {
+    DebateFormat.ONE_TO_ONE: Facilitator._run_one_to_one_debate,
+    DebateFormat.CROSS_EXAM: Facilitator._run_cross_examination,
+    DebateFormat.MANY_ON_ONE: Facilitator._run_many_on_one,
+    DebateFormat.PANEL: Facilitator._run_panel_discussion,
+    DebateFormat.ROUND_ROBIN: Facilitator._run_round_robin,
+}
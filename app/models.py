@@ -5,11 +5,19 @@ Defines request/response models for the FastAPI application supporting
 multiple debate formats.
 """
 
-from pydantic import BaseModel, Field
+import sys
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import List, Optional, Dict, Any, Literal
+from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 
 
+# Speaker/role/model names repeat on every message of a debate; interning
+# keeps one string object per name and makes their comparisons pointer checks
+_intern = sys.intern
+
+
 # === ENUMS ===
 
 class DebateFormat(str, Enum):
@@ -62,33 +70,69 @@ class BiasLevel(str, Enum):
     HIGH = "High"
 
 
+# === FIELD LITERALS ===
+# Plain-string unions used as field types on hot-path models. They validate
+# as simple string checks (no Enum member lookup) and dump without an Enum
+# round-trip; the Enum classes above remain the named constants.
+
+DistortionModeName = Literal["echo_er", "invert_er", "what_if_er", "so_what_er", "cucumb_er", "archiv_er"]
+DistortionToneName = Literal["neutral", "technical", "primal", "poetic", "satirical"]
+ConvergenceStatusName = Literal["Converging", "Diverging", "Stable", "Unknown"]
+SensitivityLevelName = Literal["Low", "Medium", "High"]
+BiasLevelName = Literal["Low", "Neutral", "High"]
+
+
 # === PARTICIPANT MODELS ===
 
 class ParticipantConfig(BaseModel):
-    """Configuration for a single participant."""
+    """
+    Configuration for a single participant.
+    
+    Frozen: a participant's settings are fixed for the whole debate, and
+    frozen models are hashable, so a config can key a cache or a set.
+    """
+    model_config = ConfigDict(frozen=True)
+    
     role: str = Field(description="Participant role (e.g., 'debater1', 'examiner')")
     label: str = Field(description="Display label for the participant")
     model: str = Field(description="LLM model name or 'USER'")
-    mode: DistortionMode = Field(description="Distortion mode")
-    tone: DistortionTone = Field(description="Tone variation")
+    mode: DistortionModeName = Field(description="Distortion mode")
+    tone: DistortionToneName = Field(description="Tone variation")
+    
+    @field_validator("role", "label", "model")
+    @classmethod
+    def _intern_names(cls, v: str) -> str:
+        return _intern(v)
 
 
 # === MESSAGE MODELS ===
 
-class DebateMessage(BaseModel):
-    """A single message in the debate transcript."""
-    speaker: str = Field(description="Speaker name/label")
-    content: str = Field(description="Message content")
-    role: str = Field(description="Speaker role")
-    iteration: Optional[int] = Field(default=None, description="Iteration number")
-    timestamp: Optional[str] = Field(default=None, description="Message timestamp")
+@dataclass(slots=True)
+class DebateMessage:
+    """
+    A single message in the debate transcript.
+    
+    Slotted dataclass rather than a BaseModel: transcripts hold many of
+    these, and Pydantic still validates and serializes them where they
+    appear as fields of the request/response models.
+    """
+    speaker: str                            # Speaker name/label
+    content: str                            # Message content
+    role: str                               # Speaker role
+    iteration: Optional[int] = None         # Iteration number
+    timestamp: Optional[datetime] = None    # Message timestamp (UTC)
+    
+    def __post_init__(self):
+        self.speaker = _intern(self.speaker)
+        self.role = _intern(self.role)
 
 
-class KeyStatement(BaseModel):
+@dataclass(slots=True)
+class KeyStatement:
     """A key statement summary."""
-    speaker: str = Field(description="Speaker name")
-    text: str = Field(description="Summary of key point")
-    iteration: Optional[int] = Field(default=None, description="Iteration number")
+    speaker: str                       # Speaker name
+    text: str                          # Summary of key point
+    iteration: Optional[int] = None    # Iteration number
 
 
 # === METRICS MODELS ===
@@ -98,10 +142,10 @@ class DebateMetrics(BaseModel):
     iteration: int = Field(description="Current iteration number")
     status: str = Field(description="Debate status")
     agreementScore: Optional[float] = Field(default=None, description="Agreement score (0-10)")
-    convergenceStatus: Optional[ConvergenceStatus] = Field(default=None)
-    emotionalSensitivity: Optional[SensitivityLevel] = Field(default=None)
-    biasLevel: Optional[BiasLevel] = Field(default=None)
-    topicDrift: Optional[SensitivityLevel] = Field(default=None)
+    convergenceStatus: Optional[ConvergenceStatusName] = None
+    emotionalSensitivity: Optional[SensitivityLevelName] = None
+    biasLevel: Optional[BiasLevelName] = None
+    topicDrift: Optional[SensitivityLevelName] = None
 
 
 # === RECORD FILE MODELS ===
@@ -115,7 +159,17 @@ class RecordFile(BaseModel):
 
 # === REQUEST MODELS ===
 
-class DebateV4Request(BaseModel):
+class _RequestModel(BaseModel):
+    """
+    Shared base for incoming request bodies.
+    
+    Requests are read-only once parsed: frozen instances skip assignment
+    validation, and unknown keys sent by the frontend are dropped.
+    """
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
+
+
+class DebateV4Request(_RequestModel):
     """Request model for V4 debate."""
     topic: str = Field(..., description="Debate topic/question", min_length=1)
     format: DebateFormat = Field(..., description="Debate format")
@@ -125,14 +179,14 @@ class DebateV4Request(BaseModel):
     gain: Optional[int] = Field(default=5, ge=1, le=10, description="Debate intensity")
 
 
-class UserInputRequest(BaseModel):
+class UserInputRequest(_RequestModel):
     """Request for submitting user input during debate."""
     debateId: str = Field(..., description="Debate session ID")
     userId: str = Field(..., description="User participant ID")
     content: str = Field(..., description="User's input text")
 
 
-class GenerateTurnRequest(BaseModel):
+class GenerateTurnRequest(_RequestModel):
     """Request for generating a single participant turn."""
     topic: str = Field(..., description="Debate topic", min_length=1)
     participant: ParticipantConfig = Field(..., description="Participant to generate for")
@@ -143,7 +197,7 @@ class GenerateTurnRequest(BaseModel):
     format: Optional[DebateFormat] = Field(default=None, description="Debate format context")
 
 
-class AnalyzeDebateRequest(BaseModel):
+class AnalyzeDebateRequest(_RequestModel):
     """Request for analyzing debate and generating metrics."""
     topic: str = Field(..., description="Debate topic")
     messages: List[DebateMessage] = Field(..., description="Debate messages to analyze")
@@ -188,20 +242,35 @@ class DebateV4Response(BaseModel):
     messages: List[DebateMessage] = Field(description="Debate transcript")
     metrics: DebateMetrics = Field(description="Current debate metrics")
     
-    keyStatements: Optional[List[KeyStatement]] = Field(default=None)
-    recordFile: Optional[RecordFile] = Field(default=None)
+    keyStatements: Optional[List[KeyStatement]] = None
+    recordFile: Optional[RecordFile] = None
     
     completed: bool = Field(description="Whether debate is completed")
-    convergenceReached: Optional[bool] = Field(default=None)
+    convergenceReached: Optional[bool] = None
     
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
 
+class DebateJobAccepted(BaseModel):
+    """Response for a debate submitted to run in the background."""
+    job_id: str = Field(description="Background debate job ID")
+    status_url: str = Field(description="URL to poll for the job's progress")
+
+
+class DebateJobStatus(BaseModel):
+    """Progress of a background debate job."""
+    job_id: str = Field(description="Background debate job ID")
+    status: Literal["running", "completed", "failed"] = Field(description="Job status")
+    messages: List[DebateMessage] = Field(description="Transcript generated so far")
+    result: Optional[DebateV4Response] = Field(default=None, description="Full debate once completed")
+    error: Optional[str] = Field(default=None, description="Error message if failed")
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str = Field(description="Overall health status")
     ollama_available: bool = Field(description="Ollama service availability")
-    timestamp: str = Field(description="Check timestamp")
+    timestamp: datetime = Field(description="Check timestamp (UTC)")
 
 
 # === STREAMING MODELS (for future WebSocket support) ===
@@ -212,18 +281,54 @@ class DebateStreamEvent(BaseModel):
         description="Event type"
     )
     data: Dict[str, Any] = Field(description="Event data")
-    timestamp: str = Field(description="Event timestamp")
+    timestamp: datetime = Field(description="Event timestamp (UTC)")
 
 
 # === INTERNAL MODELS ===
 
-class DebateState(BaseModel):
+@dataclass(slots=True)
+class DebateTurn:
+    """
+    Lightweight debate message used inside the facilitator.
+    
+    Built once per LLM turn; converted to DebateMessage only when
+    returned over the API. The truncated forms used in prompts are cut
+    once here instead of at every prompt build.
+    """
+    speaker: str
+    content: str
+    role: str
+    iteration: Optional[int] = None
+    timestamp: Optional[datetime] = None
+    
+    context_snippet: str = field(init=False, repr=False)   # content[:300], for context windows
+    preview_snippet: str = field(init=False, repr=False)   # content[:200], for summaries
+    
+    def __post_init__(self):
+        self.speaker = _intern(self.speaker)
+        self.role = _intern(self.role)
+        self.context_snippet = self.content[:300]
+        self.preview_snippet = self.content[:200]
+    
+    def to_message(self) -> DebateMessage:
+        """Convert to the API DebateMessage (drops the prompt snippets)."""
+        return DebateMessage(
+            speaker=self.speaker,
+            content=self.content,
+            role=self.role,
+            iteration=self.iteration,
+            timestamp=self.timestamp
+        )
+
+
+@dataclass(slots=True)
+class DebateState:
     """Internal state for an active debate (not exposed via API)."""
     debateId: str
     topic: str
     format: DebateFormat
     participants: List[ParticipantConfig]
-    messages: List[DebateMessage]
+    messages: List[DebateTurn]
     metrics: DebateMetrics
     keyStatements: List[KeyStatement]
     
@@ -232,7 +337,7 @@ class DebateState(BaseModel):
     convergenceReached: bool = False
     
     # For tracking participants who haven't responded
-    pendingParticipants: List[str] = []
+    pendingParticipants: List[str] = field(default_factory=list)
     
     # User participation tracking
     userParticipantRole: Optional[str] = None
@@ -257,4 +362,4 @@ class ErrorResponse(BaseModel):
     """Error response model."""
     error: str = Field(description="Error message")
     detail: Optional[str] = Field(default=None, description="Detailed error information")
-    timestamp: str = Field(description="Error timestamp")
+    timestamp: datetime = Field(description="Error timestamp (UTC)")
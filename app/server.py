@@ -5,17 +5,38 @@ Provides web interface for multi-format debate system.
 """
 
 import os
-from pathlib import Path
-from datetime import datetime
-from fastapi import FastAPI, HTTPException
+import asyncio
+import logging
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from fastapi import FastAPI, HTTPException, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 from fastapi.staticfiles import StaticFiles
+import orjson
 import requests as _http_requests
 
+try:
+    import ormsgpack
+except ImportError:  # optional: MessagePack responses are off without it
+    ormsgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
 from app.models import (
     DebateV4Request,
     DebateV4Response,
+    DebateJobAccepted,
+    DebateJobStatus,
+    DebateTurn,
     GenerateTurnRequest,
     GenerateTurnResponse,
     AnalyzeDebateRequest,
@@ -23,19 +44,32 @@ from app.models import (
     ConfigResponse,
     ModelsResponse,
     HealthResponse,
+    DebateStreamEvent,
     DebateMessage,
     DebateMetrics,
+    ConvergenceStatus,
+    SensitivityLevel,
+    BiasLevel,
     KeyStatement,
     RecordFile
 )
-from app.facilitator import Facilitator
+from app.facilitator import Facilitator, gather_or_cancel
+from utils.ollama_client import OllamaClient
 from app import config
 
+# Endpoint logging; level from LOG_LEVEL (DEBUG with VERBOSE). Detail such
+# as prompts and raw LLM replies is logged at DEBUG, so it isn't even
+# formatted at the default INFO level.
+logger = logging.getLogger("twisteddebate")
+logging.basicConfig(format="%(levelname)s:     %(message)s")
+logger.setLevel("DEBUG" if config.VERBOSE else config.LOG_LEVEL.upper())
+
 # Initialize FastAPI app
 app = FastAPI(
     title="TwistedDebate V4",
     description="Multi-format debate system using Ollama",
-    version="4.0.0"
+    version="4.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -47,18 +81,78 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Gzip responses over 1 KB (full debates, transcripts, static assets) for
+# clients that accept it. The streaming endpoints are left uncompressed:
+# the gzip stream would hold events back until enough data built up.
+_UNCOMPRESSED_PATHS = frozenset({"/api/debate-v4/stream", "/api/debate-v4/events"})
+
+
+class _GZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that skips the streaming debate endpoints."""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in _UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app.add_middleware(_GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # Mount static files directory
-static_dir = Path(__file__).parent.parent / "static"
+static_dir = config.STATIC_DIR
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
-# Mount outputs directory for debate records
-outputs_dir = Path(__file__).parent.parent / "outputs"
-outputs_dir.mkdir(exist_ok=True)
+# Mount outputs directory for debate records (created by config on import)
+outputs_dir = config.OUTPUTS_DIR
 app.mount("/outputs", StaticFiles(directory=outputs_dir), name="outputs")
 
 # Initialize Facilitator
 facilitator = Facilitator(verbose=config.VERBOSE)
 
+
+def get_ollama_client() -> OllamaClient:
+    """
+    Shared Ollama client for request handlers.
+    
+    Reuses the facilitator's client, so every endpoint draws on the same
+    keep-alive connection pools. Override with app.dependency_overrides
+    in tests.
+    """
+    return facilitator.ollama_client
+
+
+_warmup_task = None
+
+
+@app.on_event("startup")
+async def warm_up_ollama():
+    """Open pooled Ollama connections in the background before the first debate."""
+    global _warmup_task
+    logger.info(
+        "[TwistedDebate V4] Ollama parallel slots: %d "
+        "(start Ollama with a matching OLLAMA_NUM_PARALLEL so concurrent turns don't queue)",
+        config.OLLAMA_NUM_PARALLEL
+    )
+    _warmup_task = asyncio.create_task(
+        facilitator.ollama_client.warmup(config.OLLAMA_NUM_PARALLEL)
+    )
+
+
+@app.on_event("startup")
+async def build_openapi_schema():
+    """Generate the OpenAPI schema now so the first /docs hit doesn't pay for it."""
+    app.openapi()
+
+
+@app.on_event("shutdown")
+async def close_facilitator():
+    """Stop background debates and release pooled Ollama connections on shutdown."""
+    for job in active_debates.values():
+        job.task.cancel()
+    await facilitator.ollama_client.aclose()
+    facilitator.close()
+
 # TwistedCore integration
 _TWISTEDCORE_URL = os.getenv("TWISTEDCORE_URL", "http://localhost:8020")
 
@@ -81,6 +175,28 @@ def _notify_twistedcore(event_type: str, session_id: str, source_path: str) -> N
         pass  # TwistedCore being down must never affect TwistedDebate
 
 
+def _model_response(model: BaseModel, accept: Optional[str] = None) -> Response:
+    """
+    Serialize a response model straight to JSON bytes.
+    
+    Uses the model's own serializer, which Pydantic compiles once per class
+    (the same cached core serializer a TypeAdapter would hold), so nested
+    message and key-statement lists are encoded in one pass on the Rust
+    side without an intermediate dict or FastAPI's jsonable_encoder.
+    
+    Args:
+        model: Response model to serialize
+        accept: Request Accept header; MessagePack is sent when it asks for
+            application/msgpack and ormsgpack is installed, JSON otherwise
+    """
+    if accept and ormsgpack is not None and MSGPACK_MEDIA_TYPE in accept:
+        return Response(
+            content=ormsgpack.packb(model.model_dump(mode="json")),
+            media_type=MSGPACK_MEDIA_TYPE
+        )
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @app.get("/")
 async def root():
     """Serve V4 debate web interface."""
@@ -91,24 +207,42 @@ async def root():
         raise HTTPException(status_code=404, detail="index.html not found")
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """Check system health."""
-    health_status = facilitator.check_health()
+# /health is polled often and its body is fixed apart from two values
+_HEALTH_BODY = {
+    True: b'{"status":"healthy","ollama_available":true,"timestamp":"%s"}',
+    False: b'{"status":"degraded","ollama_available":false,"timestamp":"%s"}',
+}
+
+
+@app.get("/health", response_model=None, responses={200: {"model": HealthResponse}})
+async def health_check() -> Response:
+    """
+    Check system health.
+    
+    The Ollama probe uses blocking HTTP calls (up to 5 s per server when
+    Ollama is down), so it runs in a worker thread to keep the event loop free.
+    """
+    health_status = await asyncio.to_thread(facilitator.check_health)
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ").encode()
     
-    return HealthResponse(
-        status="healthy" if health_status["ollama_available"] else "degraded",
-        ollama_available=health_status["ollama_available"],
-        timestamp=datetime.utcnow().isoformat()
+    return Response(
+        content=_HEALTH_BODY[bool(health_status["ollama_available"])] % timestamp,
+        media_type="application/json"
     )
 
 
-@app.get("/api/models", response_model=ModelsResponse)
-async def list_models():
-    """List available Ollama models for selection."""
+@app.get("/api/models", response_model=None, responses={200: {"model": ModelsResponse}})
+async def list_models(refresh: bool = False) -> Response:
+    """
+    List available Ollama models for selection.
+    
+    The model list is cached by the Ollama client for a short TTL, so page
+    loads don't each query Ollama; pass ?refresh=1 to fetch it anew. A
+    fetch runs in a worker thread so it doesn't block the event loop.
+    """
     try:
-        models = facilitator.list_ollama_models()
-        return ModelsResponse(models=models)
+        models = await asyncio.to_thread(facilitator.list_ollama_models, refresh)
+        return _model_response(ModelsResponse.model_construct(models=models))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -116,25 +250,55 @@ async def list_models():
         )
 
 
-@app.get("/api/config", response_model=ConfigResponse)
-async def get_config():
+# Modes, tones and their descriptions are static, so /api/config is encoded once
+_CONFIG_JSON = ConfigResponse.model_construct(
+    modes=list(config.AVAILABLE_DISTORTION_MODES),
+    tones=list(config.AVAILABLE_TONES),
+    modeDescriptions=config.DISTORTION_MODE_DESCRIPTIONS,
+    toneDescriptions=config.TONE_DESCRIPTIONS
+).model_dump_json()
+
+
+@app.get("/api/config", response_model=None, responses={200: {"model": ConfigResponse}})
+async def get_config() -> Response:
     """Get configuration including available modes and tones."""
-    try:
-        return ConfigResponse(
-            modes=[mode for mode in config.AVAILABLE_DISTORTION_MODES],
-            tones=[tone for tone in config.AVAILABLE_TONES],
-            modeDescriptions=config.DISTORTION_MODE_DESCRIPTIONS,
-            toneDescriptions=config.TONE_DESCRIPTIONS
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error fetching config: {str(e)}"
-        )
+    return Response(content=_CONFIG_JSON, media_type="application/json")
+
+
+def _debate_response(request: DebateV4Request, result: Dict[str, Any]) -> DebateV4Response:
+    """
+    Wrap a facilitator result as the V4 response model.
+    
+    The facilitator already builds every field from validated models, so
+    the dict is passed through unvalidated; fields it leaves out (such as
+    recordFile) take their model defaults.
+    
+    Args:
+        request: The debate request that was run
+        result: Dict returned by facilitator.run_debate_async()
+        
+    Returns:
+        DebateV4Response with run metadata attached
+    """
+    return DebateV4Response.model_construct(
+        **result,
+        metadata={
+            "timestamp": datetime.now(timezone.utc),
+            "maxIterations": request.maxIterations,
+            "gain": request.gain
+        }
+    )
 
 
-@app.post("/api/debate-v4", response_model=DebateV4Response)
-async def generate_debate_v4(request: DebateV4Request):
+@app.post(
+    "/api/debate-v4",
+    response_model=None,
+    responses={200: {"model": DebateV4Response, "content": {MSGPACK_MEDIA_TYPE: {}}}}
+)
+async def generate_debate_v4(
+    request: DebateV4Request,
+    accept: Optional[str] = Header(default=None)
+) -> Response:
     """
     Generate V4 debate based on selected format.
     
@@ -144,41 +308,29 @@ async def generate_debate_v4(request: DebateV4Request):
     - Many-on-One Examination
     - Panel Discussion
     - Round Robin
+    
+    Responds with MessagePack instead of JSON when the client sends
+    `Accept: application/msgpack` (requires ormsgpack).
     """
-    print(f"\n[V4 Endpoint] Received {request.format.value} debate request")
-    print(f"[V4 Endpoint] Topic: {request.topic[:50]}...")
-    print(f"[V4 Endpoint] Participants: {len(request.participants)}")
-    print(f"[V4 Endpoint] Max iterations: {request.maxIterations}, Gain: {request.gain}")
+    logger.info("[V4 Endpoint] Received %s debate request", request.format.value)
+    logger.debug("[V4 Endpoint] Topic: %.50s...", request.topic)
+    logger.debug("[V4 Endpoint] Participants: %d", len(request.participants))
+    logger.debug("[V4 Endpoint] Max iterations: %s, Gain: %s", request.maxIterations, request.gain)
     
     try:
         # Run the debate
-        print("[V4 Endpoint] Calling facilitator.run_debate()...")
-        result = facilitator.run_debate(
+        logger.debug("[V4 Endpoint] Calling facilitator.run_debate_async()...")
+        result = await facilitator.run_debate_async(
             topic=request.topic,
             format=request.format,
             participants=request.participants,
             max_iterations=request.maxIterations,
             gain=request.gain
         )
-        print("[V4 Endpoint] Debate completed successfully")
+        logger.info("[V4 Endpoint] Debate completed successfully")
         
         # Convert result to response model
-        response = DebateV4Response(
-            topic=result["topic"],
-            format=result["format"],
-            participants=result["participants"],
-            messages=result["messages"],
-            metrics=result["metrics"],
-            keyStatements=result.get("keyStatements", []),
-            recordFile=result.get("recordFile"),
-            completed=result["completed"],
-            convergenceReached=result.get("convergenceReached"),
-            metadata={
-                "timestamp": datetime.utcnow().isoformat(),
-                "maxIterations": request.maxIterations,
-                "gain": request.gain
-            }
-        )
+        response = _debate_response(request, result)
         
         # Save results (optional - implement later)
         # try:
@@ -187,227 +339,373 @@ async def generate_debate_v4(request: DebateV4Request):
         # except Exception as e:
         #     print(f"[TwistedDebate V4] Warning: Failed to save record: {e}")
         
-        return response
+        return _model_response(response, accept)
         
     except ValueError as e:
         # Validation errors
-        print(f"\n[V4 Endpoint ERROR] Validation error: {str(e)}")
+        logger.warning("[V4 Endpoint ERROR] Validation error: %s", e)
         raise HTTPException(
             status_code=400,
             detail=f"Invalid request: {str(e)}"
         )
     except Exception as e:
         # Other errors
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"\n[V4 Endpoint ERROR] {str(e)}")
-        print(f"[V4 Endpoint ERROR] Full traceback:\n{error_trace}")
+        logger.exception("[V4 Endpoint ERROR] %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error processing V4 debate: {str(e)}"
         )
 
 
-@app.post("/api/generate-turn", response_model=GenerateTurnResponse)
-async def generate_turn(request: GenerateTurnRequest):
-    """
-    Generate a single participant's turn in the debate.
-    
-    Used for interactive debates where turns are generated one at a time
-    instead of running the full debate at once.
-    """
-    print(f"\n[Generate Turn] Participant: {request.participant.label}")
-    print(f"[Generate Turn] Iteration: {request.iteration}")
-    print(f"[Generate Turn] Max Iterations: {request.maxIterations}")
-    
-    try:
-        # Build context from previous messages
-        context_parts = []
-        is_first_turn = not request.previousMessages or len(request.previousMessages) == 0
-        # Check if this participant is a moderator
-        is_moderator = 'moderator' in request.participant.role.lower()
-        # Moderator summary happens AFTER all iterations complete (iteration > maxIterations)
-        is_moderator_summary_turn = request.iteration > request.maxIterations and is_moderator
-        
-        if request.previousMessages:
-            # Moderators need ALL messages (both intermediate and final turns) to synthesize discussion
-            # Regular debaters only need last 3 messages for context efficiency
-            if is_moderator:
-                recent_messages = request.previousMessages  # ALL messages for moderator synthesis
-            else:
-                recent_messages = request.previousMessages[-3:]  # Last 3 messages only for regular debaters
-            
-            for msg in recent_messages:
-                # For final summary, include full messages with special header
-                # For moderator intermediate turns, include full messages with different header
-                # For regular debaters, truncate long messages
-                if is_moderator_summary_turn:
-                    # Final summary - don't truncate, use complete transcript
-                    context_parts.append(f"{msg.speaker}: {msg.content}")
-                elif is_moderator:
-                    # Intermediate moderator turn - include full content
-                    context_parts.append(f"{msg.speaker}: {msg.content}")
-                else:
-                    # Regular debater - truncate long messages
-                    content_preview = msg.content[:200] + "..." if len(msg.content) > 200 else msg.content
-                    context_parts.append(f"{msg.speaker}: {content_preview}")
-        
-        # Generate response using facilitator's internal method
-        from utils.ollama_client import OllamaClient
-        from datetime import datetime
-        
-        ollama = OllamaClient()
-        
-        # Mode-specific role guidance (simplified for debates, not TwistedPair distortion)
-        mode_guidance = {
-            "echo_er": "Focus on positive aspects and opportunities. Amplify what's working.",
-            "invert_er": "Challenge assumptions. Point out what's missing or contradictory.",
-            "what_if_er": "Explore alternative scenarios. Ask 'what if' questions.",
-            "so_what_er": "Question implications. Ask 'so what' and demand practical impact.",
-            "cucumb_er": "Stay analytical and composed. Provide systematic analysis.",
-            "archiv_er": "Connect to history and precedents. Provide context from past examples."
-        }
-        
-        mode_hint = mode_guidance.get(request.participant.mode.value, "Provide your perspective.")
-        tone_instruction = config.TONE_INSTRUCTIONS.get(request.participant.tone.value, "")
-        
-        # Check if this is a USER participant
-        is_user = request.participant.model == 'USER'
-        
-        # Build prompt based on whether this is first turn, moderator summary, or regular turn
-        if is_moderator_summary_turn and is_moderator and not is_user:
-            # Final moderator summary
-            context = "\n".join(context_parts) if context_parts else ""
-            full_prompt = f"""You are {request.participant.label}, the moderator of this debate.
-
-Topic: {request.topic}
-
-Complete debate transcript:
-{context}
-
-This is the FINAL SUMMARY. Your job is to:
-- Summarize EACH participant's key arguments (do NOT omit any participant)
-- Identify points of agreement and disagreement across ALL participants
-- Highlight the strongest points from each perspective
-- Provide a brief but comprehensive conclusion without declaring a winner
-
-IMPORTANT: Make sure to cover ALL participants who spoke. Do not leave anyone out.
-IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into the summary.
-
-Style: {tone_instruction}
+def _encode_event(event_type: str, data: Dict[str, Any]) -> bytes:
+    """Encode one DebateStreamEvent as JSON."""
+    return DebateStreamEvent.model_construct(
+        type=event_type,
+        data=data,
+        timestamp=datetime.now(timezone.utc)
+    ).model_dump_json().encode()
 
-Provide a comprehensive closing summary (MAX 200 words)."""
-        elif is_first_turn:
-            if is_moderator:
-                # Moderator opening
-                full_prompt = f"""You are {request.participant.label}, the moderator of this debate.
 
-Topic: {request.topic}
-
-This is the opening. Your job is to:
-- Welcome the participants
-- Clearly state the debate topic
-- Explain the format briefly
-- Invite participants to begin
+def _ndjson_frame(event_type: str, payload: bytes) -> bytes:
+    """Frame an encoded event as one newline-delimited JSON line."""
+    return payload + b"\n"
 
-Style: {tone_instruction}
 
-IMPORTANT: Do NOT introduce yourself by name or use placeholder text like "[Your Name]". Your role is already displayed. Jump straight into your opening.
+def _sse_frame(event_type: str, payload: bytes) -> bytes:
+    """Frame an encoded event as a Server-Sent Events message."""
+    return b"event: " + event_type.encode() + b"\ndata: " + payload + b"\n\n"
 
-Provide a brief opening statement (MAX 100 words). Be welcoming and clear."""
-            else:
-                # Regular participant opening
-                full_prompt = f"""You are {request.participant.label} in a debate.
 
-Topic: {request.topic}
+async def _debate_events(request: DebateV4Request, frame: Callable[[str, bytes], bytes]):
+    """
+    Run a debate and yield its events as they happen, framed for the wire.
+    
+    Yields one "message" event per turn as soon as it is generated, then a
+    single "complete" event carrying metrics, key statements and completion
+    flags, or an "error" event if the debate fails part-way.
+    
+    Args:
+        request: Debate to run
+        frame: Wraps each encoded event for the response format
+    """
+    def emit(event_type: str, data: Dict[str, Any]) -> bytes:
+        return frame(event_type, _encode_event(event_type, data))
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    debate = asyncio.create_task(facilitator.run_debate_async(
+        topic=request.topic,
+        format=request.format,
+        participants=request.participants,
+        max_iterations=request.maxIterations,
+        gain=request.gain,
+        on_turn=queue.put_nowait
+    ))
+    debate.add_done_callback(lambda _: queue.put_nowait(None))
+    
+    try:
+        while (turn := await queue.get()) is not None:
+            yield emit("message", {"message": turn.to_message()})
+        
+        result = debate.result()
+        yield emit("complete", {
+            "metrics": result["metrics"],
+            "keyStatements": result.get("keyStatements", []),
+            "recordFile": result.get("recordFile"),
+            "completed": result["completed"],
+            "convergenceReached": result.get("convergenceReached")
+        })
+        logger.info("[V4 Stream] Debate completed successfully")
+    except Exception as e:
+        logger.exception("[V4 Stream ERROR] %s", e)
+        yield emit("error", {"error": str(e)})
+    finally:
+        # Client went away mid-debate: stop generating further turns
+        debate.cancel()
 
-This is your opening statement. Present your initial perspective on the topic.
 
-Your role: {mode_hint}
-Style: {tone_instruction}
+@app.post("/api/debate-v4/stream")
+async def stream_debate_v4(request: DebateV4Request) -> StreamingResponse:
+    """
+    Run a V4 debate and stream it as newline-delimited JSON.
+    
+    Each line is a DebateStreamEvent (see _debate_events).
+    """
+    logger.info("[V4 Stream] Received %s debate request", request.format.value)
+    return StreamingResponse(_debate_events(request, _ndjson_frame), media_type="application/x-ndjson")
 
-IMPORTANT: Do NOT introduce yourself by name or use placeholder text like "[Your Name]". Your identity is already displayed. Jump straight into your argument.
 
-Provide a brief opening (MAX 100 words). Be specific and direct."""
-        else:
-            # Subsequent turns - respond to previous discussion
-            context = "\n".join(context_parts)
-            
-            if is_moderator:
-                full_prompt = f"""You are {request.participant.label}, the moderator of this debate.
+@app.post("/api/debate-v4/events")
+async def stream_debate_v4_sse(request: DebateV4Request) -> StreamingResponse:
+    """
+    Run a V4 debate and stream it as Server-Sent Events.
+    
+    Each SSE message is named after the DebateStreamEvent type ("message",
+    "complete" or "error") and carries the event JSON as its data. Since
+    the debate settings are a POST body, read it with fetch() and a stream
+    reader rather than EventSource (which only issues GETs).
+    """
+    logger.info("[V4 Stream] Received %s debate request (SSE)", request.format.value)
+    return StreamingResponse(
+        _debate_events(request, _sse_frame),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-Topic: {request.topic}
 
-Full discussion so far:
-{context}
+# === BACKGROUND DEBATE JOBS ===
+# A debate runs for minutes; /api/debate-v4/jobs starts it as a task and
+# answers 202 straight away, so the client polls instead of holding a
+# connection open for the whole run.
 
-Your job is to:
-- Acknowledge key points made by EACH participant who has spoken
-- Ask clarifying questions to explore ideas further
-- Guide the discussion forward constructively
+@dataclass(slots=True)
+class DebateJob:
+    """A debate running (or finished) in the background."""
+    task: asyncio.Task
+    turns: List[DebateTurn] = field(default_factory=list)
+    response: Optional[DebateV4Response] = None
+    error: Optional[str] = None
+    finished_at: Optional[float] = None    # time.monotonic() when done
 
-IMPORTANT: If multiple participants have spoken, acknowledge ALL of them. Don't skip anyone.
-IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into moderation.
 
-Style: {tone_instruction}
+# Jobs by ID; finished jobs are dropped DEBATE_JOB_TTL seconds after they end
+active_debates: Dict[str, DebateJob] = {}
 
-Provide brief moderation (MAX 100 words)."""
-            else:
-                # Check if this is many-on-one format to customize prompts
-                is_examiner = 'examiner' in request.participant.role.lower() and 'examinee' not in request.participant.role.lower()
-                is_examinee = 'examinee' in request.participant.role.lower()
-                
-                if is_examiner:
-                    # Examiner questioning the examinee
-                    full_prompt = f"""You are {request.participant.label}, an examiner in this examination.
 
-Topic: {request.topic}
+def _purge_debate_jobs():
+    """Drop finished jobs older than config.DEBATE_JOB_TTL."""
+    cutoff = time.monotonic() - config.DEBATE_JOB_TTL
+    expired = [
+        job_id for job_id, job in active_debates.items()
+        if job.finished_at is not None and job.finished_at < cutoff
+    ]
+    for job_id in expired:
+        del active_debates[job_id]
 
-Recent discussion:
-{context}
 
-Your role: {mode_hint}
-Style: {tone_instruction}
+async def _run_debate_job(job_id: str, request: DebateV4Request):
+    """Run a debate for a background job, recording turns as they arrive."""
+    job = active_debates[job_id]
+    try:
+        result = await facilitator.run_debate_async(
+            topic=request.topic,
+            format=request.format,
+            participants=request.participants,
+            max_iterations=request.maxIterations,
+            gain=request.gain,
+            on_turn=job.turns.append
+        )
+        job.response = _debate_response(request, result)
+        logger.info("[V4 Job %s] Debate completed successfully", job_id)
+    except Exception as e:
+        logger.exception("[V4 Job %s ERROR] %s", job_id, e)
+        job.error = str(e)
+    finally:
+        job.finished_at = time.monotonic()
 
-IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into your question or challenge.
 
-Ask a probing question or present a challenge to the examinee's position. Be specific and critical (MAX 100 words)."""
-                elif is_examinee:
-                    # Examinee responding to examiners' questions
-                    full_prompt = f"""You are {request.participant.label}, the examinee responding to examiners.
+@app.post(
+    "/api/debate-v4/jobs",
+    status_code=202,
+    response_model=None,
+    responses={202: {"model": DebateJobAccepted}}
+)
+async def submit_debate_v4(request: DebateV4Request) -> Response:
+    """
+    Start a V4 debate in the background.
+    
+    Returns 202 with the job ID and the URL to poll for progress.
+    """
+    logger.info("[V4 Job] Received %s debate request", request.format.value)
+    _purge_debate_jobs()
+    
+    job_id = uuid.uuid4().hex
+    # The job is registered before its task first runs, so _run_debate_job finds it
+    active_debates[job_id] = DebateJob(task=asyncio.create_task(_run_debate_job(job_id, request)))
+    
+    body = DebateJobAccepted.model_construct(
+        job_id=job_id,
+        status_url=f"/api/debate-v4/jobs/{job_id}"
+    )
+    return Response(body.model_dump_json(), status_code=202, media_type="application/json")
 
-Topic: {request.topic}
 
-Recent discussion:
-{context}
+@app.get("/api/debate-v4/jobs/{job_id}", response_model=None, responses={200: {"model": DebateJobStatus}})
+async def get_debate_v4_job(job_id: str, accept: Optional[str] = Header(default=None)) -> Response:
+    """
+    Poll a background V4 debate.
+    
+    While running, returns the transcript so far; once completed, also the
+    full debate response. Unknown or expired jobs are 404.
+    """
+    _purge_debate_jobs()
+    job = active_debates.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Debate job not found: {job_id}")
+    
+    if job.finished_at is None:
+        status = "running"
+    else:
+        status = "failed" if job.error is not None else "completed"
+    
+    return _model_response(DebateJobStatus.model_construct(
+        job_id=job_id,
+        status=status,
+        messages=[turn.to_message() for turn in job.turns],
+        result=job.response,
+        error=job.error
+    ), accept)
 
-Your role: {mode_hint}
-Style: {tone_instruction}
 
-IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into your response.
+# Rendered (head, tail) prompt text per (turn kind, participant, topic).
+# Only the discussion context changes between a participant's turns, so the
+# rest of the prompt is rendered once per debate; identical prefixes also
+# let Ollama reuse its cached prompt evaluation.
+_TURN_PREFIX_CACHE_SIZE = 256
+_turn_prefix_cache: Dict[tuple, tuple] = {}
 
-Respond to the examiners' questions and challenges. Defend or refine your position (MAX 100 words)."""
-                else:
-                    # Regular debate participant
-                    full_prompt = f"""You are {request.participant.label} in a debate.
 
-Topic: {request.topic}
+def _turn_prompt_parts(kind: str, request: GenerateTurnRequest) -> tuple:
+    """
+    Get the static text around the context slot for one participant's turn.
+    
+    Args:
+        kind: Turn prompt kind (key of config.COMPILED_TURN_PROMPT_PARTS)
+        request: Turn request with participant and topic
+        
+    Returns:
+        (head, tail) strings; tail is None when the prompt takes no context
+    """
+    participant = request.participant
+    key = (kind, participant, request.topic)
+    parts = _turn_prefix_cache.get(key)
+    if parts is not None:
+        return parts
+    
+    fields = {
+        "participant_name": participant.label,
+        "topic": request.topic,
+        "mode_hint": config.MODE_GUIDANCE.get(participant.mode, "Provide your perspective."),
+        "tone_instruction": config.TONE_INSTRUCTIONS.get(participant.tone, ""),
+    }
+    head, tail = config.COMPILED_TURN_PROMPT_PARTS[kind]
+    parts = (head(**fields), tail(**fields) if tail is not None else None)
+    
+    if len(_turn_prefix_cache) >= _TURN_PREFIX_CACHE_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        del _turn_prefix_cache[next(iter(_turn_prefix_cache))]
+    _turn_prefix_cache[key] = parts
+    return parts
 
-Recent discussion:
-{context}
 
-Your role: {mode_hint}
-Style: {tone_instruction}
+def _recent_context(messages: List[DebateMessage], budget: int) -> str:
+    """
+    Join the most recent messages that fit in a character budget.
+    
+    Walks from the newest message back, so the prompt length stays bounded
+    however long the debate runs. The message that crosses the budget is
+    cut to the space left and marked with "...".
+    
+    Args:
+        messages: Debate messages, oldest first
+        budget: Maximum context length in characters
+        
+    Returns:
+        "speaker: content" lines, oldest first
+    """
+    lines = []
+    remaining = budget
+    for msg in reversed(messages):
+        line = f"{msg.speaker}: {msg.content}"
+        if len(line) > remaining:
+            if remaining > 0:
+                lines.append(line[:remaining] + "...")
+            break
+        lines.append(line)
+        remaining -= len(line) + 1  # newline separator
+    lines.reverse()
+    return "\n".join(lines)
+
+
+def _build_turn_prompt(request: GenerateTurnRequest) -> str:
+    """
+    Build the full prompt for one participant turn.
+    
+    Picks the moderator summary, opening or follow-up prompt for the
+    participant's role and fills it with the recent discussion.
+    
+    Args:
+        request: Turn request with participant, topic and previous messages
+        
+    Returns:
+        Prompt text for Ollama
+    """
+    is_first_turn = not request.previousMessages
+    # Check if this participant is a moderator
+    is_moderator = 'moderator' in request.participant.role.lower()
+    # Moderator summary happens AFTER all iterations complete (iteration > maxIterations)
+    is_moderator_summary_turn = request.iteration > request.maxIterations and is_moderator
+    
+    # Check if this is a USER participant
+    is_user = request.participant.model == 'USER'
+    
+    # Pick the prompt: moderator summary, first turn, or regular turn
+    if is_moderator_summary_turn and not is_user:
+        kind = "summary"
+    elif is_first_turn:
+        kind = "moderator_opening" if is_moderator else "opening"
+    elif is_moderator:
+        kind = "moderator"
+    else:
+        # Many-on-one roles get examination-specific prompts
+        role = request.participant.role.lower()
+        if 'examinee' in role:
+            kind = "examinee"
+        elif 'examiner' in role:
+            kind = "examiner"
+        else:
+            kind = "response"
+    
+    head, tail = _turn_prompt_parts(kind, request)
+    if tail is None:
+        return head
+    
+    # Build context from previous messages
+    if is_moderator:
+        # Moderators need ALL messages, untruncated, to synthesize the discussion
+        context = "\n".join(f"{msg.speaker}: {msg.content}" for msg in request.previousMessages)
+    else:
+        # Regular debaters get a sliding window of the latest messages
+        context = _recent_context(
+            request.previousMessages,
+            config.TURN_CONTEXT_TOKENS * config.CHARS_PER_TOKEN
+        )
+    
+    return head + context + tail
 
-IMPORTANT: Do NOT introduce yourself or use placeholder names. Jump straight into your response.
 
-Respond to the points raised. Provide a brief response (MAX 100 words). Be specific and direct."""
+@app.post("/api/generate-turn", response_model=None, responses={200: {"model": GenerateTurnResponse}})
+async def generate_turn(
+    request: GenerateTurnRequest,
+    ollama: OllamaClient = Depends(get_ollama_client)
+) -> Response:
+    """
+    Generate a single participant's turn in the debate.
+    
+    Used for interactive debates where turns are generated one at a time
+    instead of running the full debate at once.
+    """
+    logger.info("[Generate Turn] Participant: %s", request.participant.label)
+    logger.debug("[Generate Turn] Iteration: %s", request.iteration)
+    logger.debug("[Generate Turn] Max Iterations: %s", request.maxIterations)
+    
+    try:
+        full_prompt = _build_turn_prompt(request)
         
         # Get Ollama parameters based on gain
         ollama_params = config.get_ollama_params(request.gain or 5)
         
         # Generate response
-        response = ollama.generate(
+        response = await ollama.agenerate(
             model=request.participant.model,
             prompt=full_prompt,
             **ollama_params
@@ -419,61 +717,267 @@ Respond to the points raised. Provide a brief response (MAX 100 words). Be speci
             content=response,
             role=request.participant.role,
             iteration=request.iteration,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=datetime.now(timezone.utc)
         )
         
-        return GenerateTurnResponse(
+        return _model_response(GenerateTurnResponse.model_construct(
             message=message,
             success=True,
             error=None
-        )
+        ))
         
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"\n[Generate Turn ERROR] {str(e)}")
-        print(f"[Generate Turn ERROR] Full traceback:\n{error_trace}")
+        logger.exception("[Generate Turn ERROR] %s", e)
         
-        return GenerateTurnResponse(
+        return _model_response(GenerateTurnResponse.model_construct(
             message=DebateMessage(
                 speaker=request.participant.label,
                 content=f"Error generating response: {str(e)}",
                 role=request.participant.role,
                 iteration=request.iteration,
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=datetime.now(timezone.utc)
             ),
             success=False,
             error=str(e)
-        )
+        ))
+
+
+# Batch results are a bare list, so they are encoded with a cached adapter
+_TURN_RESPONSES = TypeAdapter(List[GenerateTurnResponse])
 
 
-@app.post("/api/analyze-debate", response_model=AnalyzeDebateResponse)
-async def analyze_debate(request: AnalyzeDebateRequest):
+@app.post(
+    "/api/generate-turn-batch",
+    response_model=None,
+    responses={200: {"model": List[GenerateTurnResponse]}}
+)
+async def generate_turn_batch(
+    turns: List[GenerateTurnRequest],
+    client: OllamaClient = Depends(get_ollama_client)
+) -> Response:
     """
-    Analyze debate messages and generate metrics using LLM.
+    Generate several participants' turns in one call.
+    
+    Turns that share a model and gain are sent to Ollama as one combined
+    prompt and split on config.BATCH_DELIMITER; if a reply doesn't split
+    into one part per turn, those turns are generated individually. Groups
+    run concurrently. Each result reports its own success/error, in the
+    same shape as /api/generate-turn.
     """
-    print(f"\n[Analyze Debate] Analyzing {len(request.messages)} messages")
-    print(f"[Analyze Debate] Iteration: {request.iteration}")
+    logger.info("[Generate Turn Batch] %d turns", len(turns))
     
-    try:
-        from utils.ollama_client import OllamaClient
+    prompts = [_build_turn_prompt(turn) for turn in turns]
+    
+    async def generate_one(i: int) -> List[Any]:
+        try:
+            return [await client.agenerate(
+                model=turns[i].participant.model,
+                prompt=prompts[i],
+                **config.get_ollama_params(turns[i].gain or 5)
+            )]
+        except Exception as e:
+            return [e]
+    
+    async def generate_group(indexes: List[int]) -> List[Any]:
+        first = turns[indexes[0]]
+        tasks = "\n\n".join(
+            f"### Task {n} ({turns[i].participant.label})\n{prompts[i]}"
+            for n, i in enumerate(indexes, 1)
+        )
+        try:
+            reply = await client.agenerate(
+                model=first.participant.model,
+                prompt=config.COMPILED_DEBATE_PROMPTS["turn_batch"](tasks=tasks),
+                **config.get_ollama_params(first.gain or 5)
+            )
+        except Exception as e:
+            return [e] * len(indexes)
         
-        ollama = OllamaClient()
+        parts = [p.strip() for p in reply.split(config.BATCH_DELIMITER)]
+        parts = [p for p in parts if p]
+        if len(parts) == len(indexes):
+            return parts
         
-        # Build conversation summary - include ALL messages with full content
-        # We have 128K context window, so no need to truncate
-        conversation = []
-        for msg in request.messages:  # ALL messages
-            speaker = msg.speaker
-            content = msg.content  # Full content, no truncation
-            conversation.append(f"{speaker}: {content}")
+        logger.warning("[Generate Turn Batch] Reply split into %d parts, "
+                       "expected %d; generating individually", len(parts), len(indexes))
+        replies = await gather_or_cancel([generate_one(i) for i in indexes])
+        return [r[0] for r in replies]
+    
+    # Group turn positions by (model, gain): one combined request per group
+    groups: Dict[tuple, List[int]] = {}
+    for i, turn in enumerate(turns):
+        groups.setdefault((turn.participant.model, turn.gain or 5), []).append(i)
+    
+    group_list = list(groups.values())
+    replies = await gather_or_cancel([
+        generate_group(indexes) if len(indexes) > 1 else generate_one(indexes[0])
+        for indexes in group_list
+    ])
+    
+    outputs: List[Any] = [None] * len(turns)
+    for indexes, texts in zip(group_list, replies):
+        for i, text in zip(indexes, texts):
+            outputs[i] = text
+    
+    timestamp = datetime.now(timezone.utc)
+    results = []
+    for turn, output in zip(turns, outputs):
+        failed = isinstance(output, Exception)
+        if failed:
+            logger.error("[Generate Turn Batch ERROR] %s: %s", turn.participant.label, output)
+        results.append(GenerateTurnResponse.model_construct(
+            message=DebateMessage(
+                speaker=turn.participant.label,
+                content=f"Error generating response: {output}" if failed else output,
+                role=turn.participant.role,
+                iteration=turn.iteration,
+                timestamp=timestamp
+            ),
+            success=not failed,
+            error=str(output) if failed else None
+        ))
+    
+    return Response(content=_TURN_RESPONSES.dump_json(results), media_type="application/json")
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """
+    Find the first balanced JSON object in LLM output.
+    
+    Single pass over the text from the first "{", tracking brace depth and
+    skipping braces inside JSON strings, so nested objects come back whole.
+    
+    Args:
+        text: LLM response that may wrap the JSON in extra prose
+        
+    Returns:
+        The "{...}" slice, or None if no object closes
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+# === ANALYSIS CACHE ===
+# Parsed metrics keyed by a digest of (topic, transcript). Replays and
+# re-analysis of an unchanged transcript skip the metrics LLM call.
+_analysis_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_analysis_cache_hits = 0
+_analysis_cache_misses = 0
+
+
+def _analysis_key(request: AnalyzeDebateRequest) -> bytes:
+    """
+    Digest the topic and every message's speaker and content.
+    
+    Fields are fed to the hash separately with separator bytes, so no
+    joined copy of the transcript is built just to key the cache.
+    
+    Args:
+        request: Analysis request
         
-        conv_text = "\n\n".join(conversation)
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    h = hashlib.blake2b(request.topic.encode(), digest_size=16)
+    update = h.update
+    for msg in request.messages:
+        update(b"\x1e")
+        update(msg.speaker.encode())
+        update(b"\x1f")
+        update(msg.content.encode())
+    return h.digest()
+
+
+def _analysis_cache_get(key: bytes) -> Optional[Dict[str, Any]]:
+    """Look up parsed metrics, marking the entry most recently used."""
+    global _analysis_cache_hits, _analysis_cache_misses
+    metrics_data = _analysis_cache.get(key)
+    if metrics_data is None:
+        _analysis_cache_misses += 1
+    else:
+        _analysis_cache_hits += 1
+        _analysis_cache.move_to_end(key)
+    if logger.isEnabledFor(logging.DEBUG):
+        total = _analysis_cache_hits + _analysis_cache_misses
+        logger.debug("[Analyze Debate] Cache %s (hit rate %d/%d = %.0f%%)",
+                     "miss" if metrics_data is None else "hit",
+                     _analysis_cache_hits, total, 100 * _analysis_cache_hits / total)
+    return metrics_data
+
+
+def _analysis_cache_put(key: bytes, metrics_data: Dict[str, Any]):
+    """Store parsed metrics, evicting the least recently used entry when full."""
+    _analysis_cache[key] = metrics_data
+    if len(_analysis_cache) > config.ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
+
+
+# Metric labels as the analysis prompt asks for them, mapped to the enums
+_CONVERGENCE_MAP = MappingProxyType({
+    "CONVERGING": ConvergenceStatus.CONVERGING,
+    "DIVERGING": ConvergenceStatus.DIVERGING,
+    "STABLE": ConvergenceStatus.STABLE
+})
+
+_SENSITIVITY_MAP = MappingProxyType({
+    "LOW": SensitivityLevel.LOW,
+    "MEDIUM": SensitivityLevel.MEDIUM,
+    "HIGH": SensitivityLevel.HIGH
+})
+
+_BIAS_MAP = MappingProxyType({
+    "LOW": BiasLevel.LOW,
+    "NEUTRAL": BiasLevel.NEUTRAL,
+    "HIGH": BiasLevel.HIGH
+})
+
+
+async def _run_analysis(request: AnalyzeDebateRequest, ollama: OllamaClient) -> Dict[str, Any]:
+    """
+    Ask the metrics model to score the debate and parse its JSON reply.
+    
+    Args:
+        request: Analysis request
+        ollama: Client to call
         
-        print(f"[Analyze Debate] Sending {len(request.messages)} messages ({len(conv_text)} chars) to {config.METRICS_MODEL}")
+    Returns:
+        Parsed metrics dict as produced by the model
         
-        # Create analysis prompt
-        analysis_prompt = f"""You are analyzing a debate to generate metrics. Be objective and precise.
+    Raises:
+        ValueError: If no JSON object can be found in the reply
+    """
+    # Build conversation summary - include ALL messages with full content
+    # We have 128K context window, so no need to truncate
+    conv_text = "\n\n".join(f"{msg.speaker}: {msg.content}" for msg in request.messages)
+    
+    logger.info("[Analyze Debate] Sending %d messages (%d chars) to %s",
+                len(request.messages), len(conv_text), config.METRICS_MODEL)
+    
+    # Create analysis prompt
+    analysis_prompt = f"""You are analyzing a debate to generate metrics. Be objective and precise.
 
 Topic: {request.topic}
 
@@ -499,98 +1003,94 @@ Analysis criteria:
 
 Respond ONLY with the JSON object, no explanation."""
 
-        # Call LLM for analysis
-        response = ollama.generate(
-            model=config.METRICS_MODEL,
-            prompt=analysis_prompt,
-            temperature=0.3,  # Low temperature for consistent analysis
-            top_p=0.8,
-            top_k=20
-        )
-        
-        print(f"[Analyze Debate] LLM Response: {response[:500]}...")  # First 500 chars
-        
-        # Parse JSON response
-        import json
-        import re
-        
-        # Extract JSON from response (in case LLM adds extra text)
-        json_match = re.search(r'\{[^}]+\}', response, re.DOTALL)
-        if json_match:
-            metrics_data = json.loads(json_match.group())
-            print(f"[Analyze Debate] Parsed metrics: {metrics_data}")
-        else:
-            print(f"[Analyze Debate] ERROR: Could not find JSON in response: {response}")
-            raise ValueError("Could not parse metrics JSON from LLM response")
-        
-        # Import enum classes
-        from app.models import ConvergenceStatus, SensitivityLevel, BiasLevel
-        
-        # Map string values to enums
-        convergence_map = {
-            "CONVERGING": ConvergenceStatus.CONVERGING,
-            "DIVERGING": ConvergenceStatus.DIVERGING,
-            "STABLE": ConvergenceStatus.STABLE
-        }
-        
-        sensitivity_map = {
-            "LOW": SensitivityLevel.LOW,
-            "MEDIUM": SensitivityLevel.MEDIUM,
-            "HIGH": SensitivityLevel.HIGH
-        }
-        
-        bias_map = {
-            "LOW": BiasLevel.LOW,
-            "NEUTRAL": BiasLevel.NEUTRAL,
-            "HIGH": BiasLevel.HIGH
-        }
+    # Call LLM for analysis
+    response = await ollama.agenerate(
+        model=config.METRICS_MODEL,
+        prompt=analysis_prompt,
+        temperature=0.3,  # Low temperature for consistent analysis
+        top_p=0.8,
+        top_k=20
+    )
+    
+    logger.debug("[Analyze Debate] LLM Response: %.500s...", response)  # First 500 chars
+    
+    # Extract JSON from response (in case LLM adds extra text)
+    json_text = _find_json_object(response)
+    if json_text:
+        metrics_data = orjson.loads(json_text)
+        logger.debug("[Analyze Debate] Parsed metrics: %s", metrics_data)
+    else:
+        logger.error("[Analyze Debate] ERROR: Could not find JSON in response: %s", response)
+        raise ValueError("Could not parse metrics JSON from LLM response")
+    
+    return metrics_data
+
+
+@app.post("/api/analyze-debate", response_model=None, responses={200: {"model": AnalyzeDebateResponse}})
+async def analyze_debate(
+    request: AnalyzeDebateRequest,
+    ollama: OllamaClient = Depends(get_ollama_client)
+) -> Response:
+    """
+    Analyze debate messages and generate metrics using LLM.
+    """
+    logger.info("[Analyze Debate] Analyzing %d messages", len(request.messages))
+    logger.debug("[Analyze Debate] Iteration: %s", request.iteration)
+    
+    try:
+        cache_key = _analysis_key(request) if config.ANALYSIS_CACHE_SIZE else None
+        metrics_data = _analysis_cache_get(cache_key) if cache_key else None
+        if metrics_data is None:
+            metrics_data = await _run_analysis(request, ollama)
+            if cache_key:
+                _analysis_cache_put(cache_key, metrics_data)
         
         # Create metrics object
-        metrics = DebateMetrics(
+        metrics = DebateMetrics.model_construct(
             iteration=request.iteration,
             status="In Progress",
             agreementScore=float(metrics_data.get("agreementScore", 5.0)),
-            convergenceStatus=convergence_map.get(
+            convergenceStatus=_CONVERGENCE_MAP.get(
                 metrics_data.get("convergenceStatus", "STABLE"),
                 ConvergenceStatus.STABLE
             ),
-            emotionalSensitivity=sensitivity_map.get(
+            emotionalSensitivity=_SENSITIVITY_MAP.get(
                 metrics_data.get("emotionalSensitivity", "LOW"),
                 SensitivityLevel.LOW
             ),
-            biasLevel=bias_map.get(
+            biasLevel=_BIAS_MAP.get(
                 metrics_data.get("biasLevel", "NEUTRAL"),
                 BiasLevel.NEUTRAL
             ),
-            topicDrift=sensitivity_map.get(
+            topicDrift=_SENSITIVITY_MAP.get(
                 metrics_data.get("topicDrift", "LOW"),
                 SensitivityLevel.LOW
             )
         )
         
-        print(f"[Analyze Debate] Final Metrics:")
-        print(f"  - Agreement Score: {metrics.agreementScore}")
-        print(f"  - Convergence Status: {metrics.convergenceStatus}")
-        print(f"  - Emotional Sensitivity: {metrics.emotionalSensitivity}")
-        print(f"  - Bias Level: {metrics.biasLevel}")
-        print(f"  - Topic Drift: {metrics.topicDrift}")
+        logger.debug(
+            "[Analyze Debate] Final Metrics:\n"
+            "  - Agreement Score: %s\n"
+            "  - Convergence Status: %s\n"
+            "  - Emotional Sensitivity: %s\n"
+            "  - Bias Level: %s\n"
+            "  - Topic Drift: %s",
+            metrics.agreementScore, metrics.convergenceStatus,
+            metrics.emotionalSensitivity, metrics.biasLevel, metrics.topicDrift
+        )
         
-        return AnalyzeDebateResponse(
+        return _model_response(AnalyzeDebateResponse.model_construct(
             metrics=metrics,
             success=True,
             error=None
-        )
+        ))
         
     except Exception as e:
-        import traceback
-        print(f"\n[Analyze Debate ERROR] {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("[Analyze Debate ERROR] %s", e)
         
         # Return baseline metrics on error
-        from app.models import ConvergenceStatus, SensitivityLevel, BiasLevel
-        
-        return AnalyzeDebateResponse(
-            metrics=DebateMetrics(
+        return _model_response(AnalyzeDebateResponse.model_construct(
+            metrics=DebateMetrics.model_construct(
                 iteration=request.iteration,
                 status="In Progress",
                 agreementScore=0.0,
@@ -601,16 +1101,13 @@ Respond ONLY with the JSON object, no explanation."""
             ),
             success=False,
             error=str(e)
-        )
+        ))
 
 
 # === OPTIONAL: User Input Endpoint (for interactive debates) ===
 
-# In-memory storage for active debates (in production, use Redis or database)
-active_debates = {}
-
 @app.post("/api/save-debate")
-async def save_debate_record(data: dict):
+async def save_debate_record(data: dict) -> ORJSONResponse:
     """
     Save debate transcript to markdown file.
     """
@@ -620,30 +1117,34 @@ async def save_debate_record(data: dict):
         messages = data.get('messages', [])
         participants = data.get('participants', [])
         gain = data.get('gain', 5)
-        timestamp = data.get('timestamp', datetime.utcnow().isoformat())
+        now = datetime.now(timezone.utc)
+        timestamp = data.get('timestamp') or now.isoformat()
         
         # Generate filename
         safe_timestamp = timestamp.replace(':', '-').replace('.', '-')[:19]
         filename = f"debate_{format_type}_{safe_timestamp}.md"
         filepath = outputs_dir / filename
         
-        # Build markdown content
-        md_content = f"""# TwistedDebate V4 - {format_type.replace('-', ' ').title()}
+        # Collect markdown sections and join once (linear, unlike repeated +=),
+        # then hand the single write to a worker thread so the disk flush
+        # doesn't block the event loop
+        parts = [f"""# TwistedDebate V4 - {format_type.replace('-', ' ').title()}
 
 **Topic:** {topic}
 
-**Date:** {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
+**Date:** {now:%Y-%m-%d %H:%M:%S UTC}
 
 **Gain Level:** {gain}/10
 
 ## Participants
 
-"""
+"""]
+        append = parts.append
         
         for p in participants:
-            md_content += f"- **{p.get('label', 'Unknown')}**: {p.get('model', 'N/A')} ({p.get('mode', 'N/A')} mode, {p.get('tone', 'N/A')} tone)\n"
+            append(f"- **{p.get('label', 'Unknown')}**: {p.get('model', 'N/A')} ({p.get('mode', 'N/A')} mode, {p.get('tone', 'N/A')} tone)\n")
         
-        md_content += "\n---\n\n## Transcript\n\n"
+        append("\n---\n\n## Transcript\n\n")
         
         for msg in messages:
             speaker = msg.get('speaker', 'Unknown')
@@ -651,30 +1152,28 @@ async def save_debate_record(data: dict):
             iteration = msg.get('iteration', '')
             turn_label = f" [Turn {iteration}]" if iteration else ""
             
-            md_content += f"### {speaker}{turn_label}\n\n{content}\n\n---\n\n"
+            append(f"### {speaker}{turn_label}\n\n{content}\n\n---\n\n")
         
-        md_content += f"\n\n*Generated by TwistedDebate V4*\n"
+        append(f"\n\n*Generated by TwistedDebate V4*\n")
+        md_content = "".join(parts)
         
         # Save file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        await asyncio.to_thread(filepath.write_text, md_content, encoding='utf-8')
         
-        print(f"[Save Debate] Saved to: {filepath}")
+        logger.info("[Save Debate] Saved to: %s", filepath)
 
         # Notify TwistedCore
         _notify_twistedcore("completion", filepath.stem, str(filepath.resolve()))
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "filename": filename,
             "path": f"/outputs/{filename}",
             "url": f"/outputs/{filename}"
-        }
+        })
         
     except Exception as e:
-        import traceback
-        print(f"[Save Debate ERROR] {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("[Save Debate ERROR] %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error saving debate: {str(e)}"
@@ -702,19 +1201,33 @@ async def submit_user_input(debate_id: str, participant_id: str, content: str):
 
 
 if __name__ == "__main__":
+    import importlib.util
     import uvicorn
     
     # Print configuration summary
     config.print_config_summary()
     
+    # uvloop and httptools come with uvicorn[standard]; fall back to the
+    # pure-Python implementations where they aren't available (e.g. Windows)
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    
+    # Multiple workers need the app as an import string; reload runs one
+    workers = 1 if config.RELOAD else config.SERVER_WORKERS
+    
+    print(f"\nEvent loop: {loop}, HTTP parser: {http}, Workers: {workers}")
     print("\nStarting TwistedDebate V4 server...")
     print(f"Access the web UI at: http://{config.SERVER_HOST}:{config.SERVER_PORT}")
     print(f"API documentation at: http://{config.SERVER_HOST}:{config.SERVER_PORT}/docs")
     print("\nPress Ctrl+C to stop the server.\n")
     
     uvicorn.run(
-        app,
+        "app.server:app" if workers > 1 or config.RELOAD else app,
         host=config.SERVER_HOST,
         port=config.SERVER_PORT,
-        reload=config.RELOAD
+        reload=config.RELOAD,
+        workers=workers,
+        log_level=config.LOG_LEVEL.lower(),
+        loop=loop,
+        http=http
     )
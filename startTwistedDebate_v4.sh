@@ -67,7 +67,7 @@ echo -e "\n${YELLOW}Press Ctrl+C to stop the server${NC}\n"
 
 # Run the server using uvicorn
 cd "$SCRIPT_DIR"
-uvicorn app.server:app --host 0.0.0.0 --port 8004 --reload
+uvicorn app.server:app --host 0.0.0.0 --port 8004 --reload --loop uvloop --http httptools
 
 # Deactivate virtual environment on exit
 deactivate
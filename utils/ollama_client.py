@@ -5,9 +5,83 @@ Handles direct Ollama API calls for distortion without TwistedPair dependency.
 Implements distortion through prompt engineering and sampling parameters.
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
+import logging
+import re
+import threading
+import time
+import zlib
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+import httpx
+import orjson
 import requests
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from typing import AsyncIterator, Dict, Any, Iterator, List, Mapping, Optional
+from dataclasses import dataclass, field
+
+try:
+    import h2
+except ImportError:  # optional: HTTP/2 to Ollama is off without it
+    h2 = None
+
+try:
+    import brotli
+except ImportError:  # optional: responses are only offered as gzip/deflate without it
+    brotli = None
+
+
+# Headers sent with every request to Ollama (compressed responses matter
+# when Ollama runs on another host, behind a compressing proxy). Brotli is
+# only advertised when requests/httpx can decode it.
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate, br" if brotli is not None else "gzip, deflate",
+    "Connection": "keep-alive",
+    "User-Agent": "TwistedDebate/4",
+}
+
+
+# Shared by all clients. Each client only emits debug messages when it is
+# verbose; levels and handlers are configured by the entry point.
+logger = logging.getLogger("twisteddebate.ollama_client")
+
+
+# Distortions sampled above this temperature are never served from cache
+DISTORT_CACHE_MAX_TEMPERATURE = 0.3
+
+# Request bodies are encoded with orjson and sent as raw bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Ollama duration units (keep_alive strings such as "10m" or "1h30m")
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def keep_alive_seconds(keep_alive) -> Optional[float]:
+    """
+    Convert an Ollama keep_alive value to seconds.
+    
+    Args:
+        keep_alive: Seconds as a number, or a duration string ("10m", "1h30m")
+        
+    Returns:
+        Seconds (negative = forever), or None if the value can't be parsed
+    """
+    if isinstance(keep_alive, (int, float)):
+        return float(keep_alive)
+    text = str(keep_alive).strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    sign = -1.0 if text.startswith("-") else 1.0
+    text = text.lstrip("+-")
+    parts = _DURATION_PART.findall(text)
+    if not parts or "".join(n + u for n, u in parts) != text:
+        return None
+    return sign * sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
 
 
 class OllamaConnectionError(Exception):
@@ -20,15 +94,24 @@ class OllamaGenerationError(Exception):
     pass
 
 
-@dataclass
+def _status_error(status_code: int, body: str) -> OllamaGenerationError:
+    """Error for a non-404 HTTP error status from Ollama."""
+    return OllamaGenerationError(f"HTTP {status_code}: {body[:200]}")
+
+
+@dataclass(slots=True, frozen=True)
 class DistortionResult:
-    """Result from a distortion operation."""
+    """
+    Result from a distortion operation.
+    
+    Slotted and frozen: evaluation sweeps keep many of these.
+    """
     output: str
     mode: str
     tone: str
     gain: int
     model: str
-    metadata: Dict[str, Any]
+    metadata: Dict[str, Any] = field(default_factory=dict)    # {} when not kept
 
 
 class OllamaClient:
@@ -41,7 +124,15 @@ class OllamaClient:
         base_url: str = "http://localhost:11434",
         default_model: str = "gemma3:27b",
         timeout: int = 300,
-        verbose: bool = False
+        verbose: bool = False,
+        models_ttl: float = 30.0,
+        http2: bool = False,
+        distort_cache_size: int = 256,
+        preload_models: Optional[List[str]] = None,
+        keep_alive_refresh: bool = True,
+        max_workers: int = 2,
+        base_urls: Optional[List[str]] = None,
+        balance: str = "least-loaded"
     ):
         """
         Initialize Ollama client.
@@ -51,54 +142,233 @@ class OllamaClient:
             default_model: Default model to use
             timeout: Request timeout in seconds
             verbose: Enable debug logging
+            models_ttl: Seconds to reuse the result of list_models()
+            http2: Let the async client negotiate HTTP/2 (needs the h2
+                package). Only takes effect over https://, e.g. Ollama
+                behind a TLS reverse proxy; Ollama itself speaks HTTP/1.1.
+            distort_cache_size: Low-temperature distortion outputs to
+                remember (0 disables the cache)
+            preload_models: Models to load into Ollama in the background
+                right away, so the first debate turn doesn't wait for a load
+            keep_alive_refresh: Re-ping the preloaded models every
+                keep_alive/2 seconds so Ollama never unloads them while idle
+            max_workers: Threads distort_many() uses; match the Ollama
+                server's OLLAMA_NUM_PARALLEL (at least 2)
+            base_urls: Several Ollama servers to spread generations over
+                (base_url is used alone if None)
+            balance: How generations pick a server: "least-loaded" (fewest
+                requests in flight) or "hash" (same prompt opening, same
+                server, so its prompt cache is reused)
         """
-        self.base_url = base_url.rstrip('/')
+        if balance not in ("least-loaded", "hash"):
+            raise ValueError(f"balance must be 'least-loaded' or 'hash', got {balance!r}")
+        
+        self.hosts = list(dict.fromkeys(u.rstrip('/') for u in (base_urls or [base_url])))
+        self.base_url = self.hosts[0]
         self.default_model = default_model
         self.timeout = timeout
         self.verbose = verbose
+        self.balance = balance
+        
+        # One pooled HTTP session per server, reused across calls
+        # (keep-alive connections; servers don't compete for one pool)
+        self._sessions = {host: self._new_session() for host in self.hosts}
+        self.session = self._sessions[self.base_url]
+        
+        # Requests in flight per server, for least-loaded balancing
+        self._inflight: Counter = Counter()
+        self._inflight_lock = threading.Lock()
+        
+        # Config settings and builders, resolved once (imported here rather
+        # than at module level to avoid a circular import with app.config)
+        from app.config import (
+            MAX_GAIN, MIN_GAIN, OLLAMA_KEEP_ALIVE, build_distortion_prompt, get_ollama_params
+        )
+        self._keep_alive = OLLAMA_KEEP_ALIVE
+        self._default_prompt_builder = build_distortion_prompt
+        self._default_param_getter = get_ollama_params
+        
+        # Default sampling parameters per gain, looked up by distort()
+        self._min_gain = MIN_GAIN
+        self._params_by_gain = tuple(get_ollama_params(g) for g in range(MIN_GAIN, MAX_GAIN + 1))
+        
+        # Cached list_models() result as (fetched_at, models)
+        self.models_ttl = models_ttl
+        self._models_cache = (0.0, [])
+        self._models_lock = threading.Lock()
+        
+        # Distortion outputs by prompt/model/params digest, least recently
+        # used first. Only near-deterministic (low temperature) runs are
+        # cached, so higher gains keep their variety.
+        self.distort_cache_size = distort_cache_size
+        self._distort_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._distort_lock = threading.Lock()
+        
+        if http2 and h2 is None:
+            logger.warning("[OllamaClient] http2 requested but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        
+        # Async HTTP client, created lazily and bound to one event loop
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Thread pool for distort_many(), created on first use. Sessions are
+        # safe to share here: each call sends its own prepared request.
+        self.max_workers = max(2, max_workers)
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
         
-        self._log(f"OllamaClient initialized: {self.base_url}")
+        # Models generated with, least recently used first (model -> last
+        # use), and how often consecutive generations switched model
+        self._resident: "OrderedDict[str, float]" = OrderedDict()
+        self._resident_lock = threading.Lock()
+        self._last_model: Optional[str] = None
+        self.model_swaps = 0
+        
+        # Background preload/keep-alive thread for preload_models
+        self.preload_models = list(preload_models or [])
+        self._keep_alive_refresh = keep_alive_refresh
+        self._preload_stop = threading.Event()
+        self._preload_thread: Optional[threading.Thread] = None
+        if self.preload_models:
+            self._start_preload()
+        
+        self._log("OllamaClient initialized: %s", ", ".join(self.hosts))
     
-    def _log(self, message: str):
-        """Print log message if verbose."""
+    def _log(self, message: str, *args):
+        """Log a debug message if verbose; args are %-formatted only when emitted."""
         if self.verbose:
-            print(f"[OllamaClient] {message}")
+            logger.debug("[OllamaClient] " + message, *args)
+    
+    @staticmethod
+    def _new_session() -> requests.Session:
+        """Create a pooled HTTP session with the default headers."""
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    @contextmanager
+    def _host_slot(self, prompt: str, system: Optional[str] = None):
+        """
+        Pick the server for one generation and count it as in flight.
+        
+        Args:
+            prompt: Prompt being sent
+            system: System prompt being sent; with the prompt's opening it
+                keys the server under "hash" balancing
+            
+        Yields:
+            Server base URL
+        """
+        if len(self.hosts) == 1:
+            yield self.base_url
+            return
+        
+        with self._inflight_lock:
+            if self.balance == "hash":
+                # Requests whose model input opens the same way land on the
+                # same server. Ollama renders the system prompt first, and it
+                # carries the static mode + tone prefix, so it leads the key.
+                # crc32 is stable across processes.
+                key = ((system or "") + prompt)[:512]
+                host = self.hosts[zlib.crc32(key.encode()) % len(self.hosts)]
+            else:
+                host = min(self.hosts, key=self._inflight.__getitem__)
+            self._inflight[host] += 1
+        try:
+            yield host
+        finally:
+            with self._inflight_lock:
+                self._inflight[host] -= 1
     
     def is_healthy(self) -> bool:
         """
         Check if Ollama server is reachable.
         
         Returns:
-            True if server is healthy
+            True if at least one server is healthy
         """
-        try:
-            response = requests.get(
-                f"{self.base_url}/api/tags",
-                timeout=5
-            )
-            return response.status_code == 200
-        except Exception as e:
-            self._log(f"Health check failed: {e}")
-            return False
+        for host in self.hosts:
+            try:
+                response = self._sessions[host].get(
+                    f"{host}/api/tags",
+                    timeout=5
+                )
+            except requests.exceptions.RequestException as e:
+                self._log("Health check failed for %s: %s", host, e)
+                continue
+            if response.status_code == 200:
+                return True
+        return False
     
-    def list_models(self) -> list:
+    def list_models(self, refresh: bool = False) -> list:
         """
         List available Ollama models.
         
+        Successful results are reused for models_ttl seconds; failures are
+        not cached. With several servers, lists the models any of them has.
+        
+        Args:
+            refresh: Ask Ollama even if a cached result is still fresh
+        
         Returns:
             List of model names
         """
-        try:
-            response = requests.get(
-                f"{self.base_url}/api/tags",
-                timeout=5
-            )
-            response.raise_for_status()
-            models = response.json().get("models", [])
-            return [m["name"] for m in models]
-        except Exception as e:
-            self._log(f"Error listing models: {e}")
-            return []
+        with self._models_lock:
+            fetched_at, models = self._models_cache
+            if not refresh and time.monotonic() - fetched_at < self.models_ttl:
+                return list(models)
+            
+            found = {}
+            answered = False
+            for host in self.hosts:
+                try:
+                    response = self._sessions[host].get(
+                        f"{host}/api/tags",
+                        timeout=5
+                    )
+                except requests.exceptions.RequestException as e:
+                    self._log("Error listing models on %s: %s", host, e)
+                    continue
+                
+                if response.status_code != 200:
+                    self._log("Error listing models on %s: HTTP %d", host, response.status_code)
+                    continue
+                try:
+                    names = [m["name"] for m in orjson.loads(response.content).get("models", [])]
+                except (orjson.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+                    # Not an Ollama reply (e.g. a proxy or login page)
+                    self._log("Error listing models on %s: unexpected reply: %s", host, e)
+                    continue
+                answered = True
+                found.update(dict.fromkeys(names))
+            
+            if not answered:
+                return []
+            models = list(found)
+            
+            self._models_cache = (time.monotonic(), models)
+            return list(models)
+    
+    def _known_models(self) -> str:
+        """Last fetched model list, for error messages (no request to Ollama)."""
+        models = self._models_cache[1]
+        return str(models) if models else "(model list not fetched yet)"
+    
+    def _transport_error(self, e: Exception, host: str) -> Exception:
+        """
+        Map a requests/httpx transport failure, or an undecodable reply body,
+        to this client's exceptions.
+        """
+        if isinstance(e, (requests.exceptions.ConnectionError, httpx.ConnectError)):
+            return OllamaConnectionError(f"Cannot connect to Ollama at {host}: {e}")
+        if isinstance(e, (requests.exceptions.Timeout, httpx.TimeoutException)):
+            return OllamaGenerationError(f"Generation timed out: {e}")
+        return OllamaGenerationError(f"Generation failed: {e}")
     
     def generate(
         self,
@@ -138,17 +408,449 @@ class OllamaClient:
         if model is None:
             model = self.default_model
         
-        self._log(f"Generating with model: {model}")
-        self._log(f"Params: temp={temperature}, top_p={top_p}, top_k={top_k}")
+        payload = self._build_payload(
+            prompt, model, system, temperature, top_p, top_k,
+            repeat_penalty, num_ctx, num_predict, kwargs
+        )
+        self._touch_model(model)
+        
+        with self._host_slot(prompt, system) as host:
+            try:
+                response = self._sessions[host].post(
+                    f"{host}/api/generate",
+                    data=orjson.dumps(payload),
+                    headers=JSON_HEADERS,
+                    timeout=self.timeout
+                )
+                
+                if response.status_code == 404:
+                    raise OllamaConnectionError(
+                        f"Model '{model}' not found. Available: {self._known_models()}"
+                    )
+                if response.status_code >= 400:
+                    raise _status_error(response.status_code, response.text)
+                
+                result = orjson.loads(response.content)
+                
+                output = result.get("response", "").strip()
+                self._log(
+                    "Generated %d chars (Content-Encoding: %s)",
+                    len(output), response.headers.get("Content-Encoding", "identity")
+                )
+                
+                return output
+                
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                raise self._transport_error(e, host)
+    
+    def generate_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        top_k: int = 40,
+        repeat_penalty: float = 1.1,
+        num_ctx: int = 128000,
+        num_predict: int = -1,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream generated text from Ollama as it is decoded.
+        
+        Synchronous counterpart of astream_generate(): takes the same
+        arguments as generate() and yields response chunks in order, so the
+        first text arrives after prefill rather than after the whole reply.
+        
+        Raises:
+            OllamaConnectionError: If server unreachable
+            OllamaGenerationError: If generation fails
+        """
+        if model is None:
+            model = self.default_model
+        
+        payload = self._build_payload(
+            prompt, model, system, temperature, top_p, top_k,
+            repeat_penalty, num_ctx, num_predict, kwargs
+        )
+        self._touch_model(model)
+        payload["stream"] = True
+        
+        with self._host_slot(prompt, system) as host:
+            try:
+                with self._sessions[host].post(
+                    f"{host}/api/generate",
+                    data=orjson.dumps(payload),
+                    headers=JSON_HEADERS,
+                    timeout=self.timeout,
+                    stream=True
+                ) as response:
+                    if response.status_code == 404:
+                        raise OllamaConnectionError(f"Model '{model}' not found")
+                    if response.status_code >= 400:
+                        raise _status_error(response.status_code, response.text)
+                    
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        chunk = orjson.loads(line)
+                        if "error" in chunk:
+                            raise OllamaGenerationError(f"Generation failed: {chunk['error']}")
+                        if chunk.get("response"):
+                            yield chunk["response"]
+                        if chunk.get("done"):
+                            break
+                        
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                raise self._transport_error(e, host)
+    
+    async def agenerate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        top_k: int = 40,
+        repeat_penalty: float = 1.1,
+        num_ctx: int = 128000,
+        num_predict: int = -1,
+        **kwargs
+    ) -> str:
+        """
+        Generate text using Ollama without blocking the event loop.
+        
+        Takes the same arguments as generate(). Concurrent calls overlap;
+        Ollama serves up to OLLAMA_NUM_PARALLEL of them at once per model.
+        
+        Returns:
+            Generated text
+            
+        Raises:
+            OllamaConnectionError: If server unreachable
+            OllamaGenerationError: If generation fails
+        """
+        if model is None:
+            model = self.default_model
+        
+        payload = self._build_payload(
+            prompt, model, system, temperature, top_p, top_k,
+            repeat_penalty, num_ctx, num_predict, kwargs
+        )
+        self._touch_model(model)
         
-        # Import config for keep_alive setting
-        from app.config import OLLAMA_KEEP_ALIVE
+        with self._host_slot(prompt, system) as host:
+            try:
+                response = await self._get_async_client().post(
+                    f"{host}/api/generate",
+                    content=orjson.dumps(payload),
+                    headers=JSON_HEADERS
+                )
+                
+                if response.status_code == 404:
+                    raise OllamaConnectionError(f"Model '{model}' not found")
+                if response.status_code >= 400:
+                    raise _status_error(response.status_code, response.text)
+                
+                result = orjson.loads(response.content)
+                
+                output = result.get("response", "").strip()
+                self._log("Generated %d chars", len(output))
+                
+                return output
+                
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                raise self._transport_error(e, host)
+    
+    async def agenerate_many(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generate replies to several prompts concurrently.
+        
+        Every prompt is sent with the same model and options (any generate()
+        keyword argument). Requests overlap, and Ollama serves up to
+        OLLAMA_NUM_PARALLEL of them at once on the loaded model.
+        
+        Args:
+            prompts: Prompts to answer
+            **kwargs: Shared generate() arguments
+            
+        Returns:
+            Generated texts in the same order as prompts
+        """
+        return list(await asyncio.gather(*[
+            self.agenerate(prompt, **kwargs) for prompt in prompts
+        ]))
+    
+    def batch_generate(self, prompts: List[str], **kwargs) -> List[str]:
+        """
+        Generate replies to several prompts concurrently from synchronous code.
+        
+        Thin wrapper around agenerate_many(); must not be called from
+        inside a running event loop.
+        """
+        async def run() -> List[str]:
+            try:
+                return await self.agenerate_many(prompts, **kwargs)
+            finally:
+                # The async client is bound to this short-lived loop
+                await self.aclose()
+        
+        return asyncio.run(run())
+    
+    async def astream_generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        top_k: int = 40,
+        repeat_penalty: float = 1.1,
+        num_ctx: int = 128000,
+        num_predict: int = -1,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text from Ollama as it is decoded.
+        
+        Takes the same arguments as generate() and yields response chunks
+        in order; joining them gives the same text as agenerate() (before
+        stripping).
+        
+        Raises:
+            OllamaConnectionError: If server unreachable
+            OllamaGenerationError: If generation fails
+        """
+        if model is None:
+            model = self.default_model
+        
+        payload = self._build_payload(
+            prompt, model, system, temperature, top_p, top_k,
+            repeat_penalty, num_ctx, num_predict, kwargs
+        )
+        self._touch_model(model)
+        payload["stream"] = True
+        
+        with self._host_slot(prompt, system) as host:
+            try:
+                async with self._get_async_client().stream(
+                    "POST",
+                    f"{host}/api/generate",
+                    content=orjson.dumps(payload),
+                    headers=JSON_HEADERS
+                ) as response:
+                    if response.status_code == 404:
+                        raise OllamaConnectionError(f"Model '{model}' not found")
+                    if response.status_code >= 400:
+                        await response.aread()
+                        raise _status_error(response.status_code, response.text)
+                    
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        chunk = orjson.loads(line)
+                        if "error" in chunk:
+                            raise OllamaGenerationError(f"Generation failed: {chunk['error']}")
+                        if chunk.get("response"):
+                            yield chunk["response"]
+                        if chunk.get("done"):
+                            break
+                        
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                raise self._transport_error(e, host)
+    
+    async def warmup(self, connections: int = 1) -> bool:
+        """
+        Open pooled connections to Ollama ahead of the first generation.
+        
+        Issues concurrent GET /api/tags requests so the async client keeps
+        that many keep-alive connections ready to each server.
+        
+        Args:
+            connections: Number of connections to open per server
+            
+        Returns:
+            True if Ollama answered at least one request
+        """
+        client = self._get_async_client()
+        results = await asyncio.gather(*[
+            client.get(f"{host}/api/tags", timeout=5)
+            for host in self.hosts
+            for _ in range(connections)
+        ], return_exceptions=True)
+        
+        ok = sum(1 for r in results if isinstance(r, httpx.Response) and r.status_code == 200)
+        self._log("Warmed up %d/%d connections", ok, len(results))
+        return ok > 0
+    
+    def preload(self, model: Optional[str] = None) -> bool:
+        """
+        Load a model into Ollama (or reset its keep_alive timer) without generating.
+        
+        Sends an empty prompt, which Ollama answers as soon as the model is
+        resident, with the configured keep_alive. Every server gets it,
+        since generations may be routed to any of them.
+        
+        Args:
+            model: Model to load (uses default if None)
+            
+        Returns:
+            True if every server loaded the model
+        """
+        return self._set_keep_alive(model or self.default_model, self._keep_alive)
+    
+    def unload(self, model: Optional[str] = None) -> bool:
+        """
+        Ask Ollama to release a model's memory now instead of after keep_alive.
+        
+        Args:
+            model: Model to unload (uses default if None)
+            
+        Returns:
+            True if every server accepted the request
+        """
+        model = model or self.default_model
+        with self._resident_lock:
+            self._resident.pop(model, None)
+        return self._set_keep_alive(model, 0)
+    
+    def _set_keep_alive(self, model: str, keep_alive) -> bool:
+        """
+        Send an empty-prompt request that sets a model's keep_alive on every server.
+        
+        Returns:
+            True if every server answered 200
+        """
+        data = orjson.dumps({"model": model, "prompt": "", "stream": False, "keep_alive": keep_alive})
+        ok = True
+        for host in self.hosts:
+            try:
+                response = self._sessions[host].post(
+                    f"{host}/api/generate",
+                    data=data,
+                    headers=JSON_HEADERS,
+                    timeout=self.timeout
+                )
+            except requests.exceptions.RequestException as e:
+                self._log("Setting keep_alive=%s for %s on %s failed: %s", keep_alive, model, host, e)
+                ok = False
+                continue
+            
+            if response.status_code != 200:
+                self._log(
+                    "Setting keep_alive=%s for %s on %s failed: HTTP %d",
+                    keep_alive, model, host, response.status_code
+                )
+                ok = False
+                continue
+            self._log("Set keep_alive=%s for %s on %s", keep_alive, model, host)
+        return ok
+    
+    def _touch_model(self, model: str):
+        """Record a generation with model, counting a swap if the model changed."""
+        with self._resident_lock:
+            if self._last_model is not None and self._last_model != model:
+                self.model_swaps += 1
+                self._log("Model swap #%d: now %s", self.model_swaps, model)
+            self._last_model = model
+            self._resident[model] = time.monotonic()
+            self._resident.move_to_end(model)
+    
+    def _start_preload(self):
+        """Start the background thread that loads and keeps preload_models resident."""
+        seconds = keep_alive_seconds(self._keep_alive)
+        if seconds == 0:
+            logger.warning("[OllamaClient] preload_models ignored: keep_alive is 0, so Ollama would unload them at once")
+            return
+        
+        # Finite keep_alive: refresh at half the TTL. Negative (forever) or
+        # unparsable values only need the initial load.
+        interval = seconds / 2 if self._keep_alive_refresh and seconds and seconds > 0 else None
+        
+        def run():
+            while True:
+                for model in self.preload_models:
+                    if self._preload_stop.is_set():
+                        return
+                    self.preload(model)
+                if interval is None or self._preload_stop.wait(interval):
+                    return
+        
+        self._preload_thread = threading.Thread(
+            target=run, name="ollama-preload", daemon=True
+        )
+        self._preload_thread.start()
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the async HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            if self._aclient is not None:
+                # Its connections belong to the other loop and can't be
+                # closed from this one; callers should aclose() before
+                # their loop ends (see batch_generate)
+                logger.warning(
+                    "[OllamaClient] Replacing an async HTTP client from another "
+                    "event loop that was not closed with aclose()"
+                )
+            self._aclient = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                headers=DEFAULT_HEADERS,
+                limits=httpx.Limits(
+                    max_keepalive_connections=40,
+                    max_connections=100,
+                    keepalive_expiry=30
+                )
+            )
+            self._aclient_loop = loop
+        return self._aclient
+    
+    async def aclose(self):
+        """Close the async HTTP client."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._aclient_loop = None
+    
+    def close(self):
+        """Stop the keep-alive refresh and close the pooled HTTP sessions."""
+        self._preload_stop.set()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        for session in self._sessions.values():
+            session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _build_payload(
+        self,
+        prompt: str,
+        model: str,
+        system: Optional[str],
+        temperature: float,
+        top_p: float,
+        top_k: int,
+        repeat_penalty: float,
+        num_ctx: int,
+        num_predict: int,
+        extra_options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the /api/generate request body."""
+        self._log("Generating with model: %s", model)
+        self._log("Params: temp=%s, top_p=%s, top_k=%s", temperature, top_p, top_k)
         
         payload = {
             "model": model,
             "prompt": prompt,
             "stream": False,
-            "keep_alive": OLLAMA_KEEP_ALIVE,  # Release GPU memory per config
+            "keep_alive": self._keep_alive,  # Release GPU memory per config
             "options": {
                 "temperature": temperature,
                 "top_p": top_p,
@@ -165,36 +867,119 @@ class OllamaClient:
             payload["system"] = system
         
         # Add any extra kwargs to options
-        payload["options"].update(kwargs)
+        payload["options"].update(extra_options)
+        
+        return payload
+    
+    def _prepare_distortion(
+        self,
+        text: str,
+        mode: str,
+        tone: str,
+        gain: int,
+        prompt_builder = None,
+        param_getter = None
+    ) -> tuple:
+        """
+        Build the prompt and sampling parameters for a distortion.
         
+        Returns:
+            (prompt, sampling_params)
+        """
+        if prompt_builder is None:
+            prompt_builder = self._default_prompt_builder
+        
+        self._log("Distorting: mode=%s, tone=%s, gain=%s", mode, tone, gain)
+        
+        # Build the prompt
         try:
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=self.timeout
-            )
-            
-            if response.status_code == 404:
-                raise OllamaConnectionError(
-                    f"Model '{model}' not found. Available: {self.list_models()}"
-                )
-            
-            response.raise_for_status()
-            result = response.json()
-            
-            output = result.get("response", "").strip()
-            self._log(f"Generated {len(output)} chars")
-            
-            return output
-            
-        except requests.exceptions.ConnectionError as e:
-            raise OllamaConnectionError(
-                f"Cannot connect to Ollama at {self.base_url}: {e}"
-            )
-        except requests.exceptions.Timeout as e:
-            raise OllamaGenerationError(f"Generation timed out: {e}")
-        except requests.exceptions.RequestException as e:
-            raise OllamaGenerationError(f"Generation failed: {e}")
+            prompt = prompt_builder(text, mode, tone)
+        except Exception as e:
+            raise ValueError(f"Error building prompt: {e}")
+        
+        # Get sampling parameters for gain level (table lookup unless a
+        # custom getter is given or gain is out of range)
+        index = gain - self._min_gain if isinstance(gain, int) else -1
+        if param_getter is None and 0 <= index < len(self._params_by_gain):
+            return prompt, self._params_by_gain[index]
+        try:
+            sampling_params = (param_getter or self._default_param_getter)(gain)
+        except Exception as e:
+            raise ValueError(f"Error getting sampling params: {e}")
+        
+        return prompt, sampling_params
+    
+    def _distortion_result(
+        self,
+        output: str,
+        prompt: str,
+        sampling_params: Dict[str, Any],
+        mode: str,
+        tone: str,
+        gain: int,
+        model: Optional[str],
+        include_metadata: bool = True
+    ) -> DistortionResult:
+        """Wrap generated text as a DistortionResult."""
+        result = DistortionResult(
+            output=output,
+            mode=mode,
+            tone=tone,
+            gain=gain,
+            model=model or self.default_model,
+            metadata={
+                "prompt_length": len(prompt),
+                "output_length": len(output),
+                # Own copy: the gain table's mappings are shared and read-only
+                "sampling_params": dict(sampling_params)
+            } if include_metadata else {}
+        )
+        
+        self._log("Distortion complete: %d chars", len(output))
+        return result
+    
+    def _distortion_key(
+        self,
+        prompt: str,
+        model: Optional[str],
+        sampling_params: Mapping[str, Any]
+    ) -> Optional[bytes]:
+        """
+        Cache key for a distortion, or None if it shouldn't be cached.
+        
+        Returns:
+            16-byte BLAKE2b digest of model, prompt and sampling parameters
+        """
+        if not self.distort_cache_size or sampling_params.get("temperature", 1.0) > DISTORT_CACHE_MAX_TEMPERATURE:
+            return None
+        h = hashlib.blake2b(digest_size=16)
+        h.update((model or self.default_model).encode())
+        h.update(b"\0")
+        h.update(prompt.encode())
+        h.update(b"\0")
+        h.update(repr(sorted(sampling_params.items())).encode())
+        return h.digest()
+    
+    def _cached_distortion(self, key: Optional[bytes]) -> Optional[str]:
+        """Look up a cached distortion output, marking it most recently used."""
+        if key is None:
+            return None
+        with self._distort_lock:
+            output = self._distort_cache.get(key)
+            if output is not None:
+                self._distort_cache.move_to_end(key)
+        if output is not None:
+            self._log("Distortion cache hit")
+        return output
+    
+    def _cache_distortion(self, key: Optional[bytes], output: str):
+        """Remember a distortion output, evicting the least recently used."""
+        if key is None:
+            return
+        with self._distort_lock:
+            self._distort_cache[key] = output
+            if len(self._distort_cache) > self.distort_cache_size:
+                self._distort_cache.popitem(last=False)
     
     def distort(
         self,
@@ -204,7 +989,9 @@ class OllamaClient:
         gain: int,
         model: Optional[str] = None,
         prompt_builder = None,
-        param_getter = None
+        param_getter = None,
+        cache: bool = True,
+        include_metadata: bool = True
     ) -> DistortionResult:
         """
         Distort text using mode/tone/gain combinations.
@@ -219,59 +1006,178 @@ class OllamaClient:
             model: Optional model override
             prompt_builder: Function to build prompt (uses config.build_distortion_prompt if None)
             param_getter: Function to get params (uses config.get_ollama_params if None)
+            cache: Reuse the output of an identical earlier low-temperature
+                distortion instead of asking Ollama again
+            include_metadata: Record prompt/output lengths and sampling
+                parameters in result.metadata ({} when False)
             
         Returns:
             DistortionResult with output and metadata
         """
-        # Import here to avoid circular dependency
-        if prompt_builder is None:
-            from app.config import build_distortion_prompt
-            prompt_builder = build_distortion_prompt
+        prompt, sampling_params = self._prepare_distortion(
+            text, mode, tone, gain, prompt_builder, param_getter
+        )
         
-        if param_getter is None:
-            from app.config import get_ollama_params
-            param_getter = get_ollama_params
+        key = self._distortion_key(prompt, model, sampling_params) if cache else None
+        output = self._cached_distortion(key)
+        if output is None:
+            # Generate with Ollama
+            try:
+                output = self.generate(
+                    prompt=prompt,
+                    model=model,
+                    **sampling_params
+                )
+            except Exception as e:
+                raise OllamaGenerationError(f"Distortion failed: {e}")
+            self._cache_distortion(key, output)
         
-        self._log(f"Distorting: mode={mode}, tone={tone}, gain={gain}")
+        return self._distortion_result(
+            output, prompt, sampling_params, mode, tone, gain, model, include_metadata
+        )
+    
+    def distort_stream(
+        self,
+        text: str,
+        mode: str,
+        tone: str,
+        gain: int,
+        model: Optional[str] = None,
+        prompt_builder = None,
+        param_getter = None
+    ) -> Iterator[str]:
+        """
+        Distort text, yielding the output as it is generated.
         
-        # Build the prompt
-        try:
-            prompt = prompt_builder(text, mode, tone)
-        except Exception as e:
-            raise ValueError(f"Error building prompt: {e}")
+        Takes the same arguments as distort(). Joining the chunks gives the
+        distorted text (unstripped).
         
-        # Get sampling parameters for gain level
-        try:
-            sampling_params = param_getter(gain)
-        except Exception as e:
-            raise ValueError(f"Error getting sampling params: {e}")
+        Yields:
+            Output text chunks, in order
+        """
+        prompt, sampling_params = self._prepare_distortion(
+            text, mode, tone, gain, prompt_builder, param_getter
+        )
         
-        # Generate with Ollama
         try:
-            output = self.generate(
+            yield from self.generate_stream(
                 prompt=prompt,
                 model=model,
                 **sampling_params
             )
         except Exception as e:
             raise OllamaGenerationError(f"Distortion failed: {e}")
+    
+    def distort_many(
+        self,
+        jobs: List[Dict[str, Any]],
+        unload_between: bool = False
+    ) -> List[DistortionResult]:
+        """
+        Run several independent distortions concurrently from synchronous code.
         
-        # Build result
-        result = DistortionResult(
-            output=output,
-            mode=mode,
-            tone=tone,
-            gain=gain,
-            model=model or self.default_model,
-            metadata={
-                "prompt_length": len(prompt),
-                "output_length": len(output),
-                "sampling_params": sampling_params
-            }
+        Unlike batch_generate(), this is safe to call from any thread, including
+        one with a running event loop. Up to max_workers requests are in flight
+        at once, so wall-clock time is about ceil(N / max_workers) calls.
+        
+        Jobs are run one model at a time, starting with the model used most
+        recently, so mixed-model batches make Ollama load each model once
+        instead of swapping back and forth.
+        
+        Args:
+            jobs: Keyword arguments for distort(), one dict per distortion
+            unload_between: Unload each model once its jobs are done, so the
+                next one loads without waiting for memory to free up
+            
+        Returns:
+            DistortionResults in the same order as jobs
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="ollama"
+                )
+            pool = self._pool
+        
+        # Group job indexes by model; a resident model goes first
+        by_model: Dict[str, List[int]] = {}
+        for i, job in enumerate(jobs):
+            by_model.setdefault(job.get("model") or self.default_model, []).append(i)
+        with self._resident_lock:
+            recency = {model: n for n, model in enumerate(self._resident)}
+        order = sorted(by_model, key=lambda m: -recency.get(m, -1))
+        
+        results: List[Optional[DistortionResult]] = [None] * len(jobs)
+        for n, model in enumerate(order):
+            futures = {i: pool.submit(self.distort, **jobs[i]) for i in by_model[model]}
+            for i, future in futures.items():
+                results[i] = future.result()
+            if unload_between and n < len(order) - 1:
+                self.unload(model)
+        
+        self._log(
+            "distort_many: %d jobs over %d models (%d swaps so far)",
+            len(jobs), len(order), self.model_swaps
+        )
+        return results
+    
+    async def adistort(
+        self,
+        text: str,
+        mode: str,
+        tone: str,
+        gain: int,
+        model: Optional[str] = None,
+        prompt_builder = None,
+        param_getter = None,
+        cache: bool = True,
+        include_metadata: bool = True
+    ) -> DistortionResult:
+        """
+        Distort text without blocking the event loop.
+        
+        Takes the same arguments as distort(), and shares its output cache.
+        
+        Returns:
+            DistortionResult with output and metadata
+        """
+        prompt, sampling_params = self._prepare_distortion(
+            text, mode, tone, gain, prompt_builder, param_getter
         )
         
-        self._log(f"Distortion complete: {len(output)} chars")
-        return result
+        key = self._distortion_key(prompt, model, sampling_params) if cache else None
+        output = self._cached_distortion(key)
+        if output is None:
+            try:
+                output = await self.agenerate(
+                    prompt=prompt,
+                    model=model,
+                    **sampling_params
+                )
+            except Exception as e:
+                raise OllamaGenerationError(f"Distortion failed: {e}")
+            self._cache_distortion(key, output)
+        
+        return self._distortion_result(
+            output, prompt, sampling_params, mode, tone, gain, model, include_metadata
+        )
+    
+    async def adistort_many(self, jobs: List[Dict[str, Any]]) -> List[DistortionResult]:
+        """
+        Run several independent distortions concurrently.
+        
+        Requests overlap, so wall-clock time approaches the slowest one
+        rather than the sum; Ollama serves up to OLLAMA_NUM_PARALLEL of
+        them at once per model (and keeps up to OLLAMA_MAX_LOADED_MODELS
+        models loaded when jobs use different models).
+        
+        Args:
+            jobs: Keyword arguments for adistort(), one dict per distortion
+            
+        Returns:
+            DistortionResults in the same order as jobs
+        """
+        return list(await asyncio.gather(*[self.adistort(**job) for job in jobs]))
 
 
 def main():
@@ -280,6 +1186,7 @@ def main():
     print("OllamaClient Test")
     print("=" * 60)
     
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     client = OllamaClient(verbose=True)
     
     # Health check